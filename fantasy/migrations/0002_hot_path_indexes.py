@@ -0,0 +1,22 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fantasy', '0001_initial'),
+        ('players', '0002_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='playerfantasystats',
+            index=models.Index(fields=['week', '-total_fantasy_points'], name='fantasy_pla_week_id_c77e81_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='playerfantasystats',
+            index=models.Index(fields=['fantasy_team', 'week'], name='fantasy_pla_fantasy_fefe93_idx'),
+        ),
+    ]
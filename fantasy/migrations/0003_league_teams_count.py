@@ -0,0 +1,26 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:02
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_teams_count(apps, schema_editor):
+    League = apps.get_model('fantasy', 'League')
+    for league in League.objects.annotate(n=Count('teams')).filter(n__gt=0):
+        League.objects.filter(pk=league.pk).update(teams_count=league.n)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fantasy', '0002_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='league',
+            name='teams_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_teams_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,216 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:03
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import F
+
+SCORING_FIELDS = (
+    'goals_points',
+    'assists_points',
+    'plus_minus_points',
+    'penalty_minutes_points',
+    'power_play_goals_points',
+    'power_play_assists_points',
+    'short_handed_goals_points',
+    'short_handed_assists_points',
+    'shots_on_goal_points',
+    'hits_points',
+    'blocked_shots_points',
+    'wins_points',
+    'losses_points',
+    'goals_against_points',
+    'saves_points',
+    'shutouts_points',
+)
+
+
+def flush_deferred_constraints(schema_editor):
+    # PostgreSQL refuses to ALTER a table with pending deferred FK checks from the UPDATE
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+        schema_editor.execute('SET CONSTRAINTS ALL DEFERRED')
+
+
+def scale_weights(apps, schema_editor):
+    FantasyScoring = apps.get_model('fantasy', 'FantasyScoring')
+    FantasyScoring.objects.update(**{field: F(field) * 100 for field in SCORING_FIELDS})
+    flush_deferred_constraints(schema_editor)
+
+
+def unscale_weights(apps, schema_editor):
+    FantasyScoring = apps.get_model('fantasy', 'FantasyScoring')
+    FantasyScoring.objects.update(**{field: F(field) * Decimal('0.01') for field in SCORING_FIELDS})
+    flush_deferred_constraints(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fantasy', '0003_league_teams_count'),
+    ]
+
+    # Widen the decimals so the scaled values fit, scale them, then switch to integers.
+    operations = [
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='goals_points',
+            field=models.DecimalField(decimal_places=2, max_digits=7),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='assists_points',
+            field=models.DecimalField(decimal_places=2, max_digits=7),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='plus_minus_points',
+            field=models.DecimalField(decimal_places=2, max_digits=7),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='penalty_minutes_points',
+            field=models.DecimalField(decimal_places=2, max_digits=7),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='power_play_goals_points',
+            field=models.DecimalField(decimal_places=2, max_digits=7),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='power_play_assists_points',
+            field=models.DecimalField(decimal_places=2, max_digits=7),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='short_handed_goals_points',
+            field=models.DecimalField(decimal_places=2, max_digits=7),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='short_handed_assists_points',
+            field=models.DecimalField(decimal_places=2, max_digits=7),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='shots_on_goal_points',
+            field=models.DecimalField(decimal_places=2, max_digits=7),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='hits_points',
+            field=models.DecimalField(decimal_places=2, max_digits=7),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='blocked_shots_points',
+            field=models.DecimalField(decimal_places=2, max_digits=7),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='wins_points',
+            field=models.DecimalField(decimal_places=2, max_digits=7),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='losses_points',
+            field=models.DecimalField(decimal_places=2, max_digits=7),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='goals_against_points',
+            field=models.DecimalField(decimal_places=2, max_digits=7),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='saves_points',
+            field=models.DecimalField(decimal_places=2, max_digits=7),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='shutouts_points',
+            field=models.DecimalField(decimal_places=2, max_digits=7),
+        ),
+        migrations.RunPython(scale_weights, unscale_weights),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='goals_points',
+            field=models.IntegerField(default=600),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='assists_points',
+            field=models.IntegerField(default=400),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='plus_minus_points',
+            field=models.IntegerField(default=100),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='penalty_minutes_points',
+            field=models.IntegerField(default=50),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='power_play_goals_points',
+            field=models.IntegerField(default=100),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='power_play_assists_points',
+            field=models.IntegerField(default=50),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='short_handed_goals_points',
+            field=models.IntegerField(default=200),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='short_handed_assists_points',
+            field=models.IntegerField(default=100),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='shots_on_goal_points',
+            field=models.IntegerField(default=40),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='hits_points',
+            field=models.IntegerField(default=60),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='blocked_shots_points',
+            field=models.IntegerField(default=100),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='wins_points',
+            field=models.IntegerField(default=400),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='losses_points',
+            field=models.IntegerField(default=-100),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='goals_against_points',
+            field=models.IntegerField(default=-100),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='saves_points',
+            field=models.IntegerField(default=60),
+        ),
+        migrations.AlterField(
+            model_name='fantasyscoring',
+            name='shutouts_points',
+            field=models.IntegerField(default=500),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+CREATE_STANDINGS_VIEW = """
+CREATE VIEW fantasy_standings AS
+SELECT
+    id AS team_id,
+    league_id,
+    wins,
+    losses,
+    ties,
+    total_points,
+    CAST(COALESCE((wins + ties * 0.5) / NULLIF(wins + losses + ties, 0), 0) AS DOUBLE PRECISION) AS win_pct
+FROM fantasy_fantasyteam
+"""
+
+DROP_STANDINGS_VIEW = 'DROP VIEW IF EXISTS fantasy_standings'
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fantasy', '0004_scaled_integer_scoring'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Standings',
+            fields=[
+                ('team', models.OneToOneField(db_column='team_id', on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='standing', serialize=False, to='fantasy.fantasyteam')),
+                ('league', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='standings', to='fantasy.league')),
+                ('wins', models.PositiveIntegerField()),
+                ('losses', models.PositiveIntegerField()),
+                ('ties', models.PositiveIntegerField()),
+                ('total_points', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('win_pct', models.FloatField()),
+            ],
+            options={
+                'db_table': 'fantasy_standings',
+                'ordering': ['-win_pct', '-total_points'],
+                'managed': False,
+            },
+        ),
+        migrations.RunSQL(CREATE_STANDINGS_VIEW, DROP_STANDINGS_VIEW),
+    ]
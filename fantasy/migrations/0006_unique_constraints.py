@@ -0,0 +1,92 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+# SQLite rebuilds fantasy_fantasyteam to change its constraints and refuses
+# while a view references the table, so drop and recreate fantasy_standings.
+CREATE_STANDINGS_VIEW = """
+CREATE VIEW fantasy_standings AS
+SELECT
+    id AS team_id,
+    league_id,
+    wins,
+    losses,
+    ties,
+    total_points,
+    CAST(COALESCE((wins + ties * 0.5) / NULLIF(wins + losses + ties, 0), 0) AS DOUBLE PRECISION) AS win_pct
+FROM fantasy_fantasyteam
+"""
+
+DROP_STANDINGS_VIEW = 'DROP VIEW IF EXISTS fantasy_standings'
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fantasy', '0005_standings_view'),
+        ('players', '0006_unique_constraints'),
+        ('teams', '0002_unique_constraints'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunSQL(DROP_STANDINGS_VIEW, CREATE_STANDINGS_VIEW),
+        migrations.AlterUniqueTogether(
+            name='fantasyteam',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='fantasyweek',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='matchup',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='playerfantasystats',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='rosterslot',
+            unique_together=set(),
+        ),
+        migrations.AddIndex(
+            model_name='league',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['is_active'], name='league_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='matchup',
+            index=models.Index(condition=models.Q(('is_complete', False)), fields=['week'], name='matchup_open_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='trade',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['from_team'], name='trade_pending_from_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='trade',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['to_team'], name='trade_pending_to_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='fantasyteam',
+            constraint=models.UniqueConstraint(fields=('owner', 'league'), name='unique_fantasy_team_owner_league'),
+        ),
+        migrations.AddConstraint(
+            model_name='fantasyweek',
+            constraint=models.UniqueConstraint(fields=('league', 'week_number'), name='unique_fantasy_week_number'),
+        ),
+        migrations.AddConstraint(
+            model_name='matchup',
+            constraint=models.UniqueConstraint(fields=('week', 'team1', 'team2'), name='unique_matchup'),
+        ),
+        migrations.AddConstraint(
+            model_name='playerfantasystats',
+            constraint=models.UniqueConstraint(fields=('player', 'week', 'fantasy_team'), name='unique_player_fantasy_week'),
+        ),
+        migrations.AddConstraint(
+            model_name='rosterslot',
+            constraint=models.UniqueConstraint(fields=('roster', 'position', 'player'), name='unique_roster_slot'),
+        ),
+        migrations.RunSQL(CREATE_STANDINGS_VIEW, DROP_STANDINGS_VIEW),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fantasy', '0006_unique_constraints'),
+        ('players', '0006_unique_constraints'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='rosterslot',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['roster'], name='roster_starting_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='rosterslot',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_active', True)), fields=('roster', 'player'), name='unique_starting_roster_player'),
+        ),
+    ]
@@ -1,4 +1,8 @@
-from django.db import models
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import Case, Count, ExpressionWrapper, F, Prefetch, Q, Value, When
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator, MaxValueValidator
 from teams.models import Season
@@ -6,6 +10,86 @@ from players.models import Player
 from games.models import Game
 
 
+# FantasyScoring weights are stored in hundredths of a point, e.g. 600 = 6.0 points
+SCALE = 100
+
+# FantasyScoring weights read by PlayerFantasyStats.calculate_fantasy_points
+SCORING_FIELDS = (
+    'goals_points', 'assists_points', 'plus_minus_points', 'penalty_minutes_points',
+    'power_play_goals_points', 'power_play_assists_points',
+    'short_handed_goals_points', 'short_handed_assists_points',
+    'shots_on_goal_points', 'hits_points', 'blocked_shots_points',
+    'wins_points', 'losses_points', 'goals_against_points', 'saves_points', 'shutouts_points',
+)
+
+# PlayerFantasyStats columns weighted by SCORING_FIELDS, in the same order
+SCORED_STATS = tuple(field.removesuffix('_points') for field in SCORING_FIELDS)
+
+SCORING_CACHE_TIMEOUT = 60 * 60
+
+
+def scoring_cache_key(league_id):
+    return f'fantasy:scoring:{league_id}'
+
+
+def get_scoring(league_id):
+    """League scoring weights as a tuple ordered like SCORING_FIELDS
+
+    Cached in the shared cache until the league's FantasyScoring changes (see
+    fantasy/signals.py and CACHES in settings).
+    """
+    key = scoring_cache_key(league_id)
+    weights = cache.get(key)
+    if weights is None:
+        weights = FantasyScoring.objects.values_list(*SCORING_FIELDS).get(league_id=league_id)
+        cache.set(key, weights, SCORING_CACHE_TIMEOUT)
+    return weights
+
+
+class BulkStatsManager(models.Manager):
+    """Manager for stats models whose derived columns are computed in Python
+
+    ``bulk_create``/``bulk_update`` bypass ``save()``, so these helpers run each
+    model's ``_compute_derived()`` over the whole list before writing it.
+    """
+
+    def compute_derived(self, objs):
+        for obj in objs:
+            obj._compute_derived()
+
+    def bulk_create_with_derived(self, objs, batch_size=1000, **kwargs):
+        objs = list(objs)
+        self.compute_derived(objs)
+        return self.bulk_create(objs, batch_size=batch_size, **kwargs)
+
+    def bulk_update_with_derived(self, objs, fields, batch_size=1000):
+        objs = list(objs)
+        self.compute_derived(objs)
+        fields = [*fields, *(f for f in self.model.DERIVED_FIELDS if f not in fields)]
+        return self.bulk_update(objs, fields, batch_size=batch_size)
+
+    def bulk_upsert(self, objs, unique_fields, batch_size=1000):
+        """Insert objs, overwriting the stats of rows that already exist"""
+        update_fields = [
+            f.name for f in self.model._meta.concrete_fields
+            if not (f.primary_key or f.generated or f.name in unique_fields or getattr(f, 'auto_now_add', False))
+        ]
+        return self.bulk_create_with_derived(
+            objs, batch_size=batch_size, update_conflicts=True,
+            unique_fields=unique_fields, update_fields=update_fields,
+        )
+
+
+class LeagueQuerySet(models.QuerySet):
+    def with_counts(self):
+        """Annotate a live team count, for when the stored counter can't be trusted"""
+        return self.annotate(_teams_count=Count('teams'))
+
+    def for_list(self):
+        """Skip the description column, which list views don't show"""
+        return self.defer('description')
+
+
 class League(models.Model):
     """Fantasy League"""
     name = models.CharField(max_length=100)
@@ -42,16 +126,21 @@ class League(models.Model):
     is_public = models.BooleanField(default=False)
     commissioner = models.ForeignKey(User, on_delete=models.CASCADE, related_name='commissioner_leagues')
 
+    # Denormalized FantasyTeam count, maintained by signals in fantasy/signals.py
+    teams_count = models.PositiveIntegerField(default=0, editable=False)
+
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = LeagueQuerySet.as_manager()
+
     def __str__(self):
         return f"{self.name} ({self.season.name})"
 
     @property
     def current_teams_count(self):
-        return self.teams.count()
+        return getattr(self, '_teams_count', self.teams_count)
 
     @property
     def is_full(self):
@@ -59,6 +148,9 @@ class League(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['is_active'], condition=Q(is_active=True), name='league_active_idx'),
+        ]
 
 
 class FantasyTeam(models.Model):
@@ -83,6 +175,11 @@ class FantasyTeam(models.Model):
     def __str__(self):
         return f"{self.name} ({self.owner.username})"
 
+    def save(self, *args, **kwargs):
+        # League.teams_count in fantasy.signals must commit or roll back with this row
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
     @property
     def win_percentage(self):
         total_games = self.wins + self.losses + self.ties
@@ -92,7 +189,38 @@ class FantasyTeam(models.Model):
 
     class Meta:
         ordering = ['-total_points']
-        unique_together = ['owner', 'league']
+        constraints = [
+            models.UniqueConstraint(fields=['owner', 'league'], name='unique_fantasy_team_owner_league'),
+        ]
+
+
+class Standings(models.Model):
+    """League standings, read from the fantasy_standings database view"""
+    team = models.OneToOneField(
+        FantasyTeam, on_delete=models.DO_NOTHING, primary_key=True,
+        db_column='team_id', related_name='standing'
+    )
+    league = models.ForeignKey(League, on_delete=models.DO_NOTHING, related_name='standings')
+    wins = models.PositiveIntegerField()
+    losses = models.PositiveIntegerField()
+    ties = models.PositiveIntegerField()
+    total_points = models.DecimalField(max_digits=10, decimal_places=2)
+    win_pct = models.FloatField()
+
+    def __str__(self):
+        return f"{self.team.name} ({self.wins}-{self.losses}-{self.ties})"
+
+    class Meta:
+        managed = False
+        db_table = 'fantasy_standings'
+        ordering = ['-win_pct', '-total_points']
+
+
+class RosterManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related('fantasy_team').prefetch_related(
+            Prefetch('slots', queryset=RosterSlot.raw_objects.select_related('position', 'player__position'))
+        )
 
 
 class Roster(models.Model):
@@ -103,6 +231,8 @@ class Roster(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = RosterManager()
+
     def __str__(self):
         return f"{self.fantasy_team.name} Roster"
 
@@ -121,6 +251,11 @@ class RosterPosition(models.Model):
         ordering = ['is_starting', 'name']
 
 
+class RosterSlotManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related('roster__fantasy_team', 'position', 'player')
+
+
 class RosterSlot(models.Model):
     """Individual roster slot for a player"""
     roster = models.ForeignKey(Roster, on_delete=models.CASCADE, related_name='slots')
@@ -130,12 +265,37 @@ class RosterSlot(models.Model):
     # Status
     is_active = models.BooleanField(default=True)  # For starting lineup
 
+    objects = RosterSlotManager()
+    raw_objects = models.Manager()
+
     def __str__(self):
-        player_name = self.player.full_name if self.player else "Empty"
+        player_name = self.player if self.player else "Empty"
         return f"{self.roster.fantasy_team.name} - {self.position.abbreviation}: {player_name}"
 
     class Meta:
-        unique_together = ['roster', 'position', 'player']
+        constraints = [
+            models.UniqueConstraint(fields=['roster', 'position', 'player'], name='unique_roster_slot'),
+            # A player can fill at most one starting slot per roster
+            models.UniqueConstraint(
+                fields=['roster', 'player'], condition=Q(is_active=True), name='unique_starting_roster_player'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['roster'], condition=Q(is_active=True), name='roster_starting_idx'),
+        ]
+
+
+class TradeQuerySet(models.QuerySet):
+    def for_list(self):
+        """Skip the message column, which list views don't show"""
+        return self.defer('message')
+
+
+class TradeManager(models.Manager.from_queryset(TradeQuerySet)):
+    def get_queryset(self):
+        return super().get_queryset().select_related('from_team', 'to_team').prefetch_related(
+            Prefetch('players', queryset=TradePlayer.objects.select_related('player', 'from_team', 'to_team'))
+        )
 
 
 class Trade(models.Model):
@@ -160,11 +320,17 @@ class Trade(models.Model):
     # Optional message
     message = models.TextField(blank=True)
 
+    objects = TradeManager()
+
     def __str__(self):
         return f"{self.from_team.name} ↔ {self.to_team.name} ({self.status})"
 
     class Meta:
         ordering = ['-proposed_date']
+        indexes = [
+            models.Index(fields=['from_team'], condition=Q(status='pending'), name='trade_pending_from_idx'),
+            models.Index(fields=['to_team'], condition=Q(status='pending'), name='trade_pending_to_idx'),
+        ]
 
 
 class TradePlayer(models.Model):
@@ -175,36 +341,43 @@ class TradePlayer(models.Model):
     to_team = models.ForeignKey(FantasyTeam, on_delete=models.CASCADE, related_name='traded_for')
 
     def __str__(self):
-        return f"{self.player.full_name}: {self.from_team.name} → {self.to_team.name}"
+        return f"{self.player}: {self.from_team.name} → {self.to_team.name}"
 
 
 class FantasyScoring(models.Model):
     """Fantasy scoring settings for a league"""
     league = models.OneToOneField(League, on_delete=models.CASCADE, related_name='scoring_settings')
 
+    # Weights are in hundredths of a point (see SCALE)
+
     # Offensive stats
-    goals_points = models.DecimalField(max_digits=5, decimal_places=2, default=6.0)
-    assists_points = models.DecimalField(max_digits=5, decimal_places=2, default=4.0)
-    plus_minus_points = models.DecimalField(max_digits=5, decimal_places=2, default=1.0)
-    penalty_minutes_points = models.DecimalField(max_digits=5, decimal_places=2, default=0.5)
-    power_play_goals_points = models.DecimalField(max_digits=5, decimal_places=2, default=1.0)
-    power_play_assists_points = models.DecimalField(max_digits=5, decimal_places=2, default=0.5)
-    short_handed_goals_points = models.DecimalField(max_digits=5, decimal_places=2, default=2.0)
-    short_handed_assists_points = models.DecimalField(max_digits=5, decimal_places=2, default=1.0)
-    shots_on_goal_points = models.DecimalField(max_digits=5, decimal_places=2, default=0.4)
-    hits_points = models.DecimalField(max_digits=5, decimal_places=2, default=0.6)
-    blocked_shots_points = models.DecimalField(max_digits=5, decimal_places=2, default=1.0)
+    goals_points = models.IntegerField(default=600)
+    assists_points = models.IntegerField(default=400)
+    plus_minus_points = models.IntegerField(default=100)
+    penalty_minutes_points = models.IntegerField(default=50)
+    power_play_goals_points = models.IntegerField(default=100)
+    power_play_assists_points = models.IntegerField(default=50)
+    short_handed_goals_points = models.IntegerField(default=200)
+    short_handed_assists_points = models.IntegerField(default=100)
+    shots_on_goal_points = models.IntegerField(default=40)
+    hits_points = models.IntegerField(default=60)
+    blocked_shots_points = models.IntegerField(default=100)
 
     # Goalie stats
-    wins_points = models.DecimalField(max_digits=5, decimal_places=2, default=4.0)
-    losses_points = models.DecimalField(max_digits=5, decimal_places=2, default=-1.0)
-    goals_against_points = models.DecimalField(max_digits=5, decimal_places=2, default=-1.0)
-    saves_points = models.DecimalField(max_digits=5, decimal_places=2, default=0.6)
-    shutouts_points = models.DecimalField(max_digits=5, decimal_places=2, default=5.0)
+    wins_points = models.IntegerField(default=400)
+    losses_points = models.IntegerField(default=-100)
+    goals_against_points = models.IntegerField(default=-100)
+    saves_points = models.IntegerField(default=60)
+    shutouts_points = models.IntegerField(default=500)
 
     def __str__(self):
         return f"{self.league.name} Scoring Settings"
 
+    @property
+    def weights(self):
+        """Scoring weights as a tuple ordered like SCORING_FIELDS"""
+        return tuple(getattr(self, field) for field in SCORING_FIELDS)
+
 
 class FantasyWeek(models.Model):
     """Fantasy week/matchup period"""
@@ -219,7 +392,34 @@ class FantasyWeek(models.Model):
 
     class Meta:
         ordering = ['week_number']
-        unique_together = ['league', 'week_number']
+        constraints = [
+            models.UniqueConstraint(fields=['league', 'week_number'], name='unique_fantasy_week_number'),
+        ]
+
+
+class MatchupQuerySet(models.QuerySet):
+    def with_winner(self):
+        """Annotate winner_id, resolved in SQL (None for ties and incomplete matchups)"""
+        return self.annotate(winner_id=Case(
+            When(is_complete=True, team1_score__gt=F('team2_score'), then=F('team1_id')),
+            When(is_complete=True, team2_score__gt=F('team1_score'), then=F('team2_id')),
+            default=None,
+            output_field=models.BigIntegerField(),
+        ))
+
+    def wins_by_team(self):
+        """Count matchup wins per fantasy team in one aggregate query"""
+        return (
+            self.with_winner()
+            .filter(winner_id__isnull=False)
+            .values('winner_id')
+            .annotate(wins=Count('pk'))
+        )
+
+
+class MatchupManager(models.Manager.from_queryset(MatchupQuerySet)):
+    def get_queryset(self):
+        return super().get_queryset().select_related('week', 'team1', 'team2')
 
 
 class Matchup(models.Model):
@@ -235,20 +435,49 @@ class Matchup(models.Model):
     # Status
     is_complete = models.BooleanField(default=False)
 
+    objects = MatchupManager()
+    raw_objects = models.Manager()
+
     def __str__(self):
         return f"{self.team1.name} vs {self.team2.name} - Week {self.week.week_number}"
 
-    @property
-    def winner(self):
+    def _resolve_winner_id(self):
         if self.is_complete:
             if self.team1_score > self.team2_score:
-                return self.team1
+                return self.team1_id
             elif self.team2_score > self.team1_score:
-                return self.team2
+                return self.team2_id
         return None
 
+    @property
+    def winner(self):
+        # Matchup.objects.with_winner() has already resolved it in SQL
+        winner_id = self.winner_id if hasattr(self, 'winner_id') else self._resolve_winner_id()
+        if winner_id is None:
+            return None
+        return self.team1 if winner_id == self.team1_id else self.team2
+
     class Meta:
-        unique_together = ['week', 'team1', 'team2']
+        constraints = [
+            models.UniqueConstraint(fields=['week', 'team1', 'team2'], name='unique_matchup'),
+        ]
+        indexes = [
+            models.Index(fields=['week'], condition=Q(is_complete=False), name='matchup_open_idx'),
+        ]
+
+
+class PlayerFantasyStatsManager(BulkStatsManager):
+    def get_queryset(self):
+        return super().get_queryset().select_related('player', 'week__league', 'fantasy_team')
+
+    def compute_derived(self, objs):
+        # Resolve every fantasy team's league in one query, then scoring once per league
+        team_leagues = dict(
+            FantasyTeam.objects.filter(pk__in={obj.fantasy_team_id for obj in objs})
+            .values_list('pk', 'league_id')
+        )
+        for obj in objs:
+            obj._compute_derived(scoring=get_scoring(team_leagues[obj.fantasy_team_id]))
 
 
 class PlayerFantasyStats(models.Model):
@@ -285,38 +514,56 @@ class PlayerFantasyStats(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
-    def calculate_fantasy_points(self):
-        """Calculate fantasy points based on league scoring settings"""
-        scoring = self.fantasy_team.league.scoring_settings
-
-        points = (
-            (self.goals * scoring.goals_points) +
-            (self.assists * scoring.assists_points) +
-            (self.plus_minus * scoring.plus_minus_points) +
-            (self.penalty_minutes * scoring.penalty_minutes_points) +
-            (self.power_play_goals * scoring.power_play_goals_points) +
-            (self.power_play_assists * scoring.power_play_assists_points) +
-            (self.short_handed_goals * scoring.short_handed_goals_points) +
-            (self.short_handed_assists * scoring.short_handed_assists_points) +
-            (self.shots_on_goal * scoring.shots_on_goal_points) +
-            (self.hits * scoring.hits_points) +
-            (self.blocked_shots * scoring.blocked_shots_points) +
-            (self.wins * scoring.wins_points) +
-            (self.losses * scoring.losses_points) +
-            (self.goals_against * scoring.goals_against_points) +
-            (self.saves * scoring.saves_points) +
-            (self.shutouts * scoring.shutouts_points)
-        )
+    objects = PlayerFantasyStatsManager()
+    raw_objects = models.Manager()
 
-        return points
+    DERIVED_FIELDS = ('total_fantasy_points',)
+
+    def calculate_fantasy_points(self, scoring=None):
+        """Calculate fantasy points based on league scoring settings
+
+        ``scoring`` is a weights tuple as returned by get_scoring(); batch callers
+        should pass it so the settings are fetched once per league.
+        """
+        if scoring is None:
+            scoring = get_scoring(self.fantasy_team.league_id)
+
+        # Integer weights keep the per-row math out of the decimal module
+        points = sum(getattr(self, stat) * weight for stat, weight in zip(SCORED_STATS, scoring))
+
+        return Decimal(points) / SCALE
+
+    def _compute_derived(self, scoring=None):
+        self.total_fantasy_points = self.calculate_fantasy_points(scoring=scoring)
 
     def save(self, *args, **kwargs):
-        self.total_fantasy_points = self.calculate_fantasy_points()
+        self._compute_derived()
         super().save(*args, **kwargs)
 
+    @classmethod
+    def recompute_week(cls, week_id):
+        """Recalculate fantasy points for every player in a week with a single UPDATE"""
+        league_id = FantasyWeek.objects.values_list('league_id', flat=True).get(pk=week_id)
+        scoring = get_scoring(league_id)
+        points = sum(
+            (F(stat) * (Decimal(weight) / SCALE) for stat, weight in zip(SCORED_STATS, scoring)),
+            Value(0),
+        )
+        return cls.objects.filter(week_id=week_id).update(
+            total_fantasy_points=ExpressionWrapper(
+                points, output_field=models.DecimalField(max_digits=10, decimal_places=2)
+            )
+        )
+
     def __str__(self):
-        return f"{self.player.full_name} - Week {self.week.week_number} ({self.total_fantasy_points} pts)"
+        return f"{self.player} - Week {self.week.week_number} ({self.total_fantasy_points} pts)"
 
     class Meta:
         ordering = ['-total_fantasy_points']
-        unique_together = ['player', 'week', 'fantasy_team']
+        constraints = [
+            models.UniqueConstraint(fields=['player', 'week', 'fantasy_team'], name='unique_player_fantasy_week'),
+        ]
+        indexes = [
+            models.Index(fields=['week', '-total_fantasy_points']),
+            models.Index(fields=['fantasy_team', 'week']),
+        ]
@@ -0,0 +1,50 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import FantasyScoring, FantasyTeam, League, scoring_cache_key
+
+
+def _add_to_teams_count(league_id, delta):
+    """Shift a league's denormalized teams_count, never taking it below zero"""
+    leagues = League.objects.filter(pk=league_id)
+    if delta < 0:
+        leagues = leagues.filter(teams_count__gte=-delta)
+    leagues.update(teams_count=F('teams_count') + delta)
+
+
+@receiver(pre_save, sender=FantasyTeam)
+def snapshot_fantasy_team_league(sender, instance, raw=False, **kwargs):
+    instance._previous_league_id = None
+    if instance.pk and not raw:
+        # Locked until FantasyTeam.save() commits, so concurrent moves apply in turn
+        instance._previous_league_id = (
+            FantasyTeam.objects.select_for_update().filter(pk=instance.pk)
+            .values_list('league_id', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=FantasyTeam)
+def count_saved_fantasy_team(sender, instance, created, **kwargs):
+    previous_league_id = getattr(instance, '_previous_league_id', None)
+    if created:
+        _add_to_teams_count(instance.league_id, 1)
+    elif previous_league_id is not None and previous_league_id != instance.league_id:
+        # Moved to another league
+        _add_to_teams_count(previous_league_id, -1)
+        _add_to_teams_count(instance.league_id, 1)
+
+
+@receiver(post_delete, sender=FantasyTeam)
+def count_deleted_fantasy_team(sender, instance, **kwargs):
+    _add_to_teams_count(instance.league_id, -1)
+
+
+@receiver(post_save, sender=FantasyScoring)
+@receiver(post_delete, sender=FantasyScoring)
+def invalidate_cached_scoring(sender, instance, **kwargs):
+    # After commit, so a concurrent get_scoring can't re-cache the old weights
+    key = scoring_cache_key(instance.league_id)
+    transaction.on_commit(lambda: cache.delete(key))
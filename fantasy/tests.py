@@ -1,3 +1,135 @@
-from django.test import TestCase
+from datetime import date
+from decimal import Decimal
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from players.models import Player, Position
+from teams.models import Season
+from .models import (
+    FantasyScoring, FantasyTeam, FantasyWeek, League, PlayerFantasyStats, get_scoring, scoring_cache_key,
+)
+
+
+class FantasyTestCase(TestCase):
+    """One league with default scoring, one fantasy team and one week"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.season = Season.objects.create(
+            name='2024-25', start_date=date(2024, 10, 4), end_date=date(2025, 4, 18), is_current=True
+        )
+        cls.owner = User.objects.create(username='owner')
+        cls.league = League.objects.create(name='Original Six', season=cls.season, commissioner=cls.owner)
+        cls.scoring = FantasyScoring.objects.create(league=cls.league)
+        cls.team = FantasyTeam.objects.create(name='Lamplighters', owner=cls.owner, league=cls.league)
+        cls.week = FantasyWeek.objects.create(
+            league=cls.league, week_number=1, start_date=date(2024, 10, 7), end_date=date(2024, 10, 13)
+        )
+        position = Position.objects.create(name='Center', abbreviation='C', category='forward')
+        cls.player = Player.objects.create(first_name='David', last_name='Pastrnak', position=position)
+
+    def add_stats(self, **stats):
+        return PlayerFantasyStats.objects.create(player=self.player, week=self.week, fantasy_team=self.team, **stats)
+
+
+class FantasyPointsTests(FantasyTestCase):
+    """Weights in hundredths of a point add up exactly, in Python and in SQL"""
+
+    def setUp(self):
+        FantasyScoring.objects.filter(pk=self.scoring.pk).update(hits_points=33, blocked_shots_points=1)
+
+    def test_hundredths_carry(self):
+        # 6.00 - 1.00 + 3 * 0.33 + 1 * 0.01
+        stats = self.add_stats(goals=1, plus_minus=-1, hits=3, blocked_shots=1)
+
+        self.assertEqual(stats.total_fantasy_points, Decimal('6.00'))
+
+    def test_smallest_weight(self):
+        stats = self.add_stats(blocked_shots=1)
+
+        self.assertEqual(stats.total_fantasy_points, Decimal('0.01'))
+
+    def test_recompute_week_matches_save(self):
+        stats = self.add_stats(goals=1, assists=2, plus_minus=-3, hits=7, blocked_shots=5, shots_on_goal=4)
+        saved_points = stats.total_fantasy_points
+        PlayerFantasyStats.objects.update(total_fantasy_points=0)
+
+        PlayerFantasyStats.recompute_week(self.week.pk)
+
+        stats.refresh_from_db()
+        self.assertEqual(stats.total_fantasy_points, saved_points)
+        self.assertEqual(saved_points, Decimal('14.96'))
+
+    def test_weights_beyond_smallint(self):
+        FantasyScoring.objects.filter(pk=self.scoring.pk).update(goals_points=99999)
+
+        self.assertEqual(self.add_stats(goals=1).total_fantasy_points, Decimal('999.99'))
+
+
+class LeagueTeamsCountTests(FantasyTestCase):
+    """League.teams_count follows fantasy teams being created, deleted and moved"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.other_league = League.objects.create(name='Expansion', season=cls.season, commissioner=cls.owner)
+
+    def assertTeamsCount(self, league, expected):
+        league.refresh_from_db()
+        self.assertEqual(league.teams_count, expected)
+        self.assertEqual(League.objects.with_counts().get(pk=league.pk).current_teams_count, expected)
+
+    def test_create(self):
+        FantasyTeam.objects.create(name='Pylons', owner=User.objects.create(username='second'), league=self.league)
+
+        self.assertTeamsCount(self.league, 2)
+
+    def test_delete(self):
+        self.team.delete()
+
+        self.assertTeamsCount(self.league, 0)
+
+    def test_move_to_another_league(self):
+        self.team.league = self.other_league
+        self.team.save()
+
+        self.assertTeamsCount(self.league, 0)
+        self.assertTeamsCount(self.other_league, 1)
+
+    def test_resave_in_same_league(self):
+        self.team.name = 'Goal Lights'
+        self.team.save()
+
+        self.assertTeamsCount(self.league, 1)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ScoringCacheTests(FantasyTestCase):
+    """Cached scoring weights are dropped once a FantasyScoring change commits"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_weight_change_is_picked_up(self):
+        stats = self.add_stats(goals=2)
+        self.assertEqual(stats.calculate_fantasy_points(), Decimal('12'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.scoring.goals_points = 750
+            self.scoring.save()
+
+        self.assertEqual(stats.calculate_fantasy_points(), Decimal('15'))
+
+    def test_cache_kept_until_commit(self):
+        weights = get_scoring(self.league.pk)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.scoring.goals_points = 750
+            self.scoring.save()
+            self.assertEqual(cache.get(scoring_cache_key(self.league.pk)), weights)
+
+        for callback in callbacks:
+            callback()
+        self.assertIsNone(cache.get(scoring_cache_key(self.league.pk)))
@@ -0,0 +1,62 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from games.models import SEASON_STAT_FIELDS, PlayerGameStats
+from players.models import PlayerStats
+from teams.models import Season
+
+ROLLUP_FIELDS = SEASON_STAT_FIELDS + ('games_played',)
+
+
+class Command(BaseCommand):
+    help = 'Reconcile PlayerStats season totals against PlayerGameStats (schedule nightly)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--season', help='Season name to rebuild (defaults to the current season)')
+
+    def handle(self, *args, **options):
+        if options['season']:
+            season = Season.objects.filter(name=options['season']).first()
+            if season is None:
+                raise CommandError(f"Season '{options['season']}' does not exist")
+        else:
+            season = Season.objects.filter(is_current=True).first()
+            if season is None:
+                raise CommandError('There is no current season; pass --season')
+
+        totals = {
+            (row.pop('player_id'), row.pop('team_id')): row
+            for row in PlayerGameStats.raw_objects.filter(game__season=season)
+            .values('player_id', 'team_id')
+            .annotate(
+                games_played=Count('pk', filter=Q(played=True)),
+                **{field: Sum(field) for field in SEASON_STAT_FIELDS},
+            )
+        }
+
+        changed = []
+        zeroed = 0
+        for stats in PlayerStats.objects.filter(season=season).only('player_id', 'team_id', *ROLLUP_FIELDS):
+            row = totals.pop((stats.player_id, stats.team_id), None)
+            if row is None:
+                # No game rows left for this player and team, so nothing to roll up
+                row = dict.fromkeys(ROLLUP_FIELDS, 0)
+                zeroed += any(getattr(stats, field) for field in ROLLUP_FIELDS)
+            if any(getattr(stats, field) != row[field] for field in ROLLUP_FIELDS):
+                for field in ROLLUP_FIELDS:
+                    setattr(stats, field, row[field])
+                changed.append(stats)
+
+        missing = [
+            PlayerStats(player_id=player_id, team_id=team_id, season=season, **row)
+            for (player_id, team_id), row in totals.items()
+        ]
+
+        with transaction.atomic():
+            PlayerStats.objects.bulk_update(changed, ROLLUP_FIELDS, batch_size=500)
+            PlayerStats.objects.bulk_create(missing, batch_size=500)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt {season.name}: {len(changed)} corrected ({zeroed} without game stats zeroed), '
+            f'{len(missing)} created'
+        ))
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0001_initial'),
+        ('players', '0001_initial'),
+        ('teams', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(fields=['season', 'game_date'], name='games_game_season__1eb495_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(fields=['status', 'game_date'], name='games_game_status_f2200a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gameevent',
+            index=models.Index(fields=['game', 'game_time_seconds'], name='games_gamee_game_id_beb371_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gameevent',
+            index=models.Index(fields=['primary_player', 'event_type'], name='games_gamee_primary_f66c02_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='playergamestats',
+            index=models.Index(fields=['game', 'team'], name='games_playe_game_id_5bf800_idx'),
+        ),
+    ]
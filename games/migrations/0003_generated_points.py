@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:01
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0002_hot_path_indexes'),
+    ]
+
+    # Django cannot alter a column into a GeneratedField, so drop and re-add it.
+    operations = [
+        migrations.RemoveField(
+            model_name='playergamestats',
+            name='points',
+        ),
+        migrations.AddField(
+            model_name='playergamestats',
+            name='points',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(models.F('goals'), '+', models.F('assists')), output_field=models.PositiveIntegerField()),
+        ),
+    ]
@@ -0,0 +1,101 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:05
+
+from django.db import migrations, models
+
+# Rows written per bulk_update, so memory and statement size stay bounded
+BATCH_SIZE = 1000
+
+
+def parse_time_in_period(apps, schema_editor):
+    for model_name in ('GameEvent', 'Goal'):
+        model = apps.get_model('games', model_name)
+        batch = []
+        for obj in model.objects.only('time_in_period').iterator(chunk_size=5000):
+            minutes, _, seconds = obj.time_in_period.partition(':')
+            try:
+                minutes, seconds = int(minutes), int(seconds or 0)
+            except ValueError:
+                minutes = seconds = -1
+            if minutes < 0 or not 0 <= seconds < 60:
+                # time_in_period is dropped below, so stop rather than lose the value
+                raise ValueError(
+                    f'{model_name} {obj.pk} has time_in_period {obj.time_in_period!r}, expected "MM:SS"; '
+                    'correct it and re-run the migration'
+                )
+            obj.time_in_period_seconds = minutes * 60 + seconds
+            batch.append(obj)
+            if len(batch) >= BATCH_SIZE:
+                model.objects.bulk_update(batch, ['time_in_period_seconds'])
+                batch = []
+        model.objects.bulk_update(batch, ['time_in_period_seconds'])
+
+
+def format_time_in_period(apps, schema_editor):
+    for model_name in ('GameEvent', 'Goal'):
+        model = apps.get_model('games', model_name)
+        batch = []
+        for obj in model.objects.only('time_in_period_seconds').iterator(chunk_size=5000):
+            minutes, seconds = divmod(obj.time_in_period_seconds, 60)
+            obj.time_in_period = f"{minutes}:{seconds:02d}"
+            batch.append(obj)
+            if len(batch) >= BATCH_SIZE:
+                model.objects.bulk_update(batch, ['time_in_period'])
+                batch = []
+        model.objects.bulk_update(batch, ['time_in_period'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0003_generated_points'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gameevent',
+            name='time_in_period_seconds',
+            field=models.PositiveSmallIntegerField(default=0),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='goal',
+            name='time_in_period_seconds',
+            field=models.PositiveSmallIntegerField(default=0),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name='gameevent',
+            name='time_in_period',
+            field=models.CharField(default='', max_length=10),
+        ),
+        migrations.AlterField(
+            model_name='goal',
+            name='time_in_period',
+            field=models.CharField(default='', max_length=10),
+        ),
+        migrations.RunPython(parse_time_in_period, format_time_in_period),
+        migrations.RemoveField(
+            model_name='gameevent',
+            name='time_in_period',
+        ),
+        migrations.RemoveField(
+            model_name='goal',
+            name='time_in_period',
+        ),
+        migrations.AlterModelOptions(
+            name='gameevent',
+            options={'ordering': ['period', 'time_in_period_seconds']},
+        ),
+        migrations.AlterModelOptions(
+            name='goal',
+            options={'ordering': ['game', 'period', 'time_in_period_seconds']},
+        ),
+        migrations.AddIndex(
+            model_name='gameevent',
+            index=models.Index(fields=['game', 'period', 'time_in_period_seconds'], name='games_gamee_game_id_c648b9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='goal',
+            index=models.Index(fields=['game', 'period', 'time_in_period_seconds'], name='games_goal_game_id_8b8093_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0004_time_in_period_seconds'),
+        ('players', '0006_unique_constraints'),
+        ('teams', '0002_unique_constraints'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='game',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='playergamestats',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='game',
+            constraint=models.UniqueConstraint(fields=('home_team', 'away_team', 'game_date'), name='unique_game_teams_date'),
+        ),
+        migrations.AddConstraint(
+            model_name='playergamestats',
+            constraint=models.UniqueConstraint(fields=('player', 'game'), name='unique_player_game_stats'),
+        ),
+    ]
@@ -0,0 +1,86 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:10
+
+from django.db import migrations, models
+
+DETAIL_COLUMNS = ('shot_type', 'zone', 'strength')
+
+# Rows written per bulk_update, so memory and statement size stay bounded
+BATCH_SIZE = 1000
+
+
+def promote_event_details(apps, schema_editor):
+    GameEvent = apps.get_model('games', 'GameEvent')
+    max_lengths = {key: GameEvent._meta.get_field(key).max_length for key in DETAIL_COLUMNS}
+    batch = []
+    for event in GameEvent.objects.only('event_details').iterator(chunk_size=5000):
+        details = event.event_details or {}
+        promoted = False
+        for key in DETAIL_COLUMNS:
+            if key not in details:
+                continue
+            value = '' if details[key] is None else str(details[key])
+            # Values the column can't hold stay in the JSON
+            if len(value) <= max_lengths[key]:
+                setattr(event, key, value)
+                del details[key]
+                promoted = True
+        if promoted:
+            batch.append(event)
+        if len(batch) >= BATCH_SIZE:
+            GameEvent.objects.bulk_update(batch, [*DETAIL_COLUMNS, 'event_details'])
+            batch = []
+    GameEvent.objects.bulk_update(batch, [*DETAIL_COLUMNS, 'event_details'])
+
+
+def demote_event_details(apps, schema_editor):
+    GameEvent = apps.get_model('games', 'GameEvent')
+    batch = []
+    for event in GameEvent.objects.only(*DETAIL_COLUMNS, 'event_details').iterator(chunk_size=5000):
+        values = {key: getattr(event, key) for key in DETAIL_COLUMNS if getattr(event, key)}
+        if values:
+            event.event_details = {**(event.event_details or {}), **values}
+            batch.append(event)
+        if len(batch) >= BATCH_SIZE:
+            GameEvent.objects.bulk_update(batch, ['event_details'])
+            batch = []
+    GameEvent.objects.bulk_update(batch, ['event_details'])
+
+
+def create_details_gin_index(apps, schema_editor):
+    # Serves containment lookups on the long-tail keys left in event_details
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE INDEX ge_details_gin ON games_gameevent USING gin (event_details)')
+
+
+def drop_details_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS ge_details_gin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0005_unique_constraints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gameevent',
+            name='shot_type',
+            field=models.CharField(blank=True, db_index=True, max_length=16),
+        ),
+        migrations.AddField(
+            model_name='gameevent',
+            name='strength',
+            field=models.CharField(blank=True, max_length=8),
+        ),
+        migrations.AddField(
+            model_name='gameevent',
+            name='zone',
+            field=models.CharField(blank=True, max_length=16),
+        ),
+        migrations.RunPython(promote_event_details, demote_event_details),
+        migrations.RunPython(create_details_gin_index, drop_details_gin_index),
+    ]
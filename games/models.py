@@ -1,9 +1,22 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
 from django.core.validators import MinValueValidator, MaxValueValidator
 from teams.models import Team, Season
 from players.models import Player
 
 
+# PlayerGameStats columns rolled up into the matching PlayerStats season row
+SEASON_STAT_FIELDS = (
+    'goals', 'assists', 'plus_minus', 'penalty_minutes', 'shots_on_goal',
+    'time_on_ice_seconds', 'saves', 'goals_against', 'shots_against',
+)
+
+
+class GameManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related('home_team', 'away_team', 'season')
+
+
 class Game(models.Model):
     """NHL Game"""
     # Basic game info
@@ -51,6 +64,9 @@ class Game(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = GameManager()
+    raw_objects = models.Manager()
+
     def __str__(self):
         return f"{self.away_team.abbreviation} @ {self.home_team.abbreviation} - {self.game_date.strftime('%Y-%m-%d')}"
 
@@ -78,7 +94,24 @@ class Game(models.Model):
 
     class Meta:
         ordering = ['-game_date']
-        unique_together = ['home_team', 'away_team', 'game_date']
+        constraints = [
+            models.UniqueConstraint(fields=['home_team', 'away_team', 'game_date'], name='unique_game_teams_date'),
+        ]
+        indexes = [
+            models.Index(fields=['season', 'game_date']),
+            models.Index(fields=['status', 'game_date']),
+        ]
+
+
+class GameEventQuerySet(models.QuerySet):
+    def for_list(self):
+        """Skip loading and decoding event_details, which list views don't show"""
+        return self.defer('event_details')
+
+
+class GameEventManager(models.Manager.from_queryset(GameEventQuerySet)):
+    def get_queryset(self):
+        return super().get_queryset().select_related('game', 'primary_player', 'secondary_player', 'team')
 
 
 class GameEvent(models.Model):
@@ -101,7 +134,7 @@ class GameEvent(models.Model):
 
     # Timing
     period = models.PositiveIntegerField(validators=[MinValueValidator(1)])
-    time_in_period = models.CharField(max_length=10)  # e.g., "12:34"
+    time_in_period_seconds = models.PositiveSmallIntegerField()  # Seconds elapsed in the period
     game_time_seconds = models.PositiveIntegerField()  # Total seconds elapsed in game
 
     # Players involved
@@ -111,17 +144,42 @@ class GameEvent(models.Model):
     # Team
     team = models.ForeignKey(Team, on_delete=models.CASCADE, related_name='game_events')
 
-    # Event-specific details (JSON field for flexibility)
+    # Commonly filtered event details, promoted out of event_details
+    shot_type = models.CharField(max_length=16, blank=True, db_index=True)  # e.g. wrist, slap, snap
+    zone = models.CharField(max_length=16, blank=True)  # offensive, neutral, defensive
+    strength = models.CharField(max_length=8, blank=True)  # even, pp, sh
+
+    # Remaining event-specific details (JSON field for flexibility)
     event_details = models.JSONField(default=dict, blank=True)
 
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = GameEventManager()
+    raw_objects = models.Manager()
+
     def __str__(self):
-        return f"{self.event_type} - {self.primary_player.full_name} ({self.time_in_period} P{self.period})"
+        return f"{self.event_type} - {self.primary_player} ({self.time_in_period_display} P{self.period})"
+
+    @property
+    def time_in_period_display(self):
+        """Convert period time seconds to MM:SS format"""
+        minutes = self.time_in_period_seconds // 60
+        seconds = self.time_in_period_seconds % 60
+        return f"{minutes}:{seconds:02d}"
 
     class Meta:
-        ordering = ['game_time_seconds']
+        ordering = ['period', 'time_in_period_seconds']
+        indexes = [
+            models.Index(fields=['game', 'game_time_seconds']),
+            models.Index(fields=['game', 'period', 'time_in_period_seconds']),
+            models.Index(fields=['primary_player', 'event_type']),
+        ]
+
+
+class GoalManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related('scorer', 'game__home_team', 'game__away_team')
 
 
 class Goal(models.Model):
@@ -134,7 +192,7 @@ class Goal(models.Model):
     # Goal details
     team = models.ForeignKey(Team, on_delete=models.CASCADE, related_name='goals_for')
     period = models.PositiveIntegerField(validators=[MinValueValidator(1)])
-    time_in_period = models.CharField(max_length=10)
+    time_in_period_seconds = models.PositiveSmallIntegerField()
     game_time_seconds = models.PositiveIntegerField()
 
     # Goal type
@@ -150,11 +208,29 @@ class Goal(models.Model):
     home_players_on_ice = models.PositiveIntegerField(default=6)
     away_players_on_ice = models.PositiveIntegerField(default=6)
 
+    objects = GoalManager()
+    raw_objects = models.Manager()
+
     def __str__(self):
-        return f"{self.scorer.full_name} ({self.time_in_period} P{self.period}) - {self.game}"
+        return f"{self.scorer} ({self.time_in_period_display} P{self.period}) - {self.game}"
+
+    @property
+    def time_in_period_display(self):
+        """Convert period time seconds to MM:SS format"""
+        minutes = self.time_in_period_seconds // 60
+        seconds = self.time_in_period_seconds % 60
+        return f"{minutes}:{seconds:02d}"
 
     class Meta:
-        ordering = ['game', 'game_time_seconds']
+        ordering = ['game', 'period', 'time_in_period_seconds']
+        indexes = [
+            models.Index(fields=['game', 'period', 'time_in_period_seconds']),
+        ]
+
+
+class PlayerGameStatsManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related('player', 'game__home_team', 'game__away_team', 'team')
 
 
 class PlayerGameStats(models.Model):
@@ -170,7 +246,11 @@ class PlayerGameStats(models.Model):
     # Basic stats
     goals = models.PositiveIntegerField(default=0)
     assists = models.PositiveIntegerField(default=0)
-    points = models.PositiveIntegerField(default=0)
+    points = models.GeneratedField(
+        expression=F('goals') + F('assists'),
+        output_field=models.PositiveIntegerField(),
+        db_persist=True,
+    )
     plus_minus = models.IntegerField(default=0)
     penalty_minutes = models.PositiveIntegerField(default=0)
 
@@ -195,13 +275,16 @@ class PlayerGameStats(models.Model):
     goals_against = models.PositiveIntegerField(default=0)
     shots_against = models.PositiveIntegerField(default=0)
 
-    def save(self, *args, **kwargs):
-        # Auto-calculate points
-        self.points = self.goals + self.assists
-        super().save(*args, **kwargs)
+    objects = PlayerGameStatsManager()
+    raw_objects = models.Manager()
 
     def __str__(self):
-        return f"{self.player.full_name} - {self.game}"
+        return f"{self.player} - {self.game}"
+
+    def save(self, *args, **kwargs):
+        # The PlayerStats rollup in games.signals must commit or roll back with this row
+        with transaction.atomic():
+            super().save(*args, **kwargs)
 
     @property
     def faceoff_percentage(self):
@@ -226,4 +309,9 @@ class PlayerGameStats(models.Model):
 
     class Meta:
         ordering = ['-game__game_date', '-points']
-        unique_together = ['player', 'game']
+        constraints = [
+            models.UniqueConstraint(fields=['player', 'game'], name='unique_player_game_stats'),
+        ]
+        indexes = [
+            models.Index(fields=['game', 'team']),
+        ]
@@ -0,0 +1,83 @@
+from collections import Counter
+
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from players.models import PlayerStats
+from .models import SEASON_STAT_FIELDS, PlayerGameStats
+
+
+def _season_totals(stats):
+    """Split a PlayerGameStats row into its PlayerStats key and contribution"""
+    key = (stats['player_id'], stats['team_id'], stats['season_id'])
+    totals = Counter({field: stats[field] for field in SEASON_STAT_FIELDS})
+    totals['games_played'] = int(stats['played'])
+    return key, totals
+
+
+def _instance_totals(instance):
+    stats = {field: getattr(instance, field) for field in SEASON_STAT_FIELDS}
+    stats.update(
+        player_id=instance.player_id,
+        team_id=instance.team_id,
+        season_id=instance.game.season_id,
+        played=instance.played,
+    )
+    return _season_totals(stats)
+
+
+def _apply_season_deltas(changes, create_key=None):
+    """Add each key's deltas to its PlayerStats row with a single F() UPDATE
+
+    Runs inside the transaction that saved or deleted the PlayerGameStats row.
+    """
+    for key, deltas in changes.items():
+        player_id, team_id, season_id = key
+        deltas = {field: delta for field, delta in deltas.items() if delta}
+        if not deltas:
+            continue
+        rows = PlayerStats.objects.filter(player_id=player_id, team_id=team_id, season_id=season_id)
+        increments = {field: F(field) + delta for field, delta in deltas.items()}
+        if not rows.update(**increments) and key == create_key:
+            # A concurrent first game for the same key may insert first; either way
+            # the row exists afterwards and the retried UPDATE applies our deltas.
+            PlayerStats.objects.bulk_create(
+                [PlayerStats(player_id=player_id, team_id=team_id, season_id=season_id)],
+                ignore_conflicts=True,
+            )
+            rows.update(**increments)
+
+
+@receiver(pre_save, sender=PlayerGameStats)
+def snapshot_game_stats(sender, instance, raw=False, **kwargs):
+    instance._season_snapshot = None
+    if instance.pk and not raw:
+        # Locked until PlayerGameStats.save() commits, so concurrent edits apply in turn
+        instance._season_snapshot = (
+            PlayerGameStats.raw_objects.select_for_update(of=('self',)).filter(pk=instance.pk)
+            .values(*SEASON_STAT_FIELDS, 'played', 'player_id', 'team_id', season_id=F('game__season_id'))
+            .first()
+        )
+
+
+@receiver(post_save, sender=PlayerGameStats)
+def roll_up_saved_game_stats(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    changes = {}
+    if getattr(instance, '_season_snapshot', None):
+        key, totals = _season_totals(instance._season_snapshot)
+        changes[key] = Counter()
+        changes[key].subtract(totals)
+    key, totals = _instance_totals(instance)
+    changes.setdefault(key, Counter()).update(totals)
+    _apply_season_deltas(changes, create_key=key)
+
+
+@receiver(post_delete, sender=PlayerGameStats)
+def roll_up_deleted_game_stats(sender, instance, **kwargs):
+    key, totals = _instance_totals(instance)
+    deltas = Counter()
+    deltas.subtract(totals)
+    _apply_season_deltas({key: deltas})
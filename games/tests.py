@@ -1,3 +1,122 @@
+from datetime import date, datetime, timezone
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
 from django.test import TestCase
 
-# Create your tests here.
+from players.models import Player, PlayerStats, Position
+from teams.models import Conference, Division, Season, Team
+from .models import Game, PlayerGameStats
+
+
+class PlayerStatsTestCase(TestCase):
+    """One player on two teams across two games of the current season"""
+
+    @classmethod
+    def setUpTestData(cls):
+        conference = Conference.objects.create(name='Eastern Conference', abbreviation='EC')
+        division = Division.objects.create(name='Atlantic Division', abbreviation='ATL', conference=conference)
+        cls.bruins = Team.objects.create(name='Bruins', city='Boston', abbreviation='BOS', division=division)
+        cls.sabres = Team.objects.create(name='Sabres', city='Buffalo', abbreviation='BUF', division=division)
+        cls.season = Season.objects.create(
+            name='2024-25', start_date=date(2024, 10, 4), end_date=date(2025, 4, 18), is_current=True
+        )
+        position = Position.objects.create(name='Center', abbreviation='C', category='forward')
+        cls.player = Player.objects.create(first_name='David', last_name='Pastrnak', position=position)
+        cls.game1 = Game.objects.create(
+            home_team=cls.bruins, away_team=cls.sabres, season=cls.season,
+            game_date=datetime(2024, 10, 10, tzinfo=timezone.utc),
+        )
+        cls.game2 = Game.objects.create(
+            home_team=cls.sabres, away_team=cls.bruins, season=cls.season,
+            game_date=datetime(2024, 10, 12, tzinfo=timezone.utc),
+        )
+
+    def add_game(self, game, team=None, **stats):
+        return PlayerGameStats.objects.create(player=self.player, game=game, team=team or self.bruins, **stats)
+
+    def season_stats(self, team=None):
+        return PlayerStats.objects.get(player=self.player, team=team or self.bruins, season=self.season)
+
+
+class PlayerStatsRollupTests(PlayerStatsTestCase):
+    """PlayerGameStats saves and deletes keep the PlayerStats season row current"""
+
+    def test_first_game_creates_season_row(self):
+        self.add_game(self.game1, goals=2, assists=1, plus_minus=-1, time_on_ice_seconds=1000)
+
+        stats = self.season_stats()
+        self.assertEqual((stats.games_played, stats.goals, stats.assists, stats.points), (1, 2, 1, 3))
+        self.assertEqual(stats.plus_minus, -1)
+        self.assertEqual(stats.average_time_on_ice_seconds, 1000)
+
+    def test_games_accumulate(self):
+        self.add_game(self.game1, goals=1, time_on_ice_seconds=1000)
+        self.add_game(self.game2, goals=2, time_on_ice_seconds=1200)
+
+        stats = self.season_stats()
+        self.assertEqual((stats.games_played, stats.goals), (2, 3))
+        self.assertEqual(stats.time_on_ice_seconds, 2200)
+        self.assertEqual(stats.average_time_on_ice_seconds, 1100)
+
+    def test_update_applies_only_the_difference(self):
+        self.add_game(self.game1, goals=1)
+        game_stats = self.add_game(self.game2, goals=1)
+
+        game_stats.goals = 3
+        game_stats.played = False
+        game_stats.save()
+
+        stats = self.season_stats()
+        self.assertEqual((stats.games_played, stats.goals), (1, 4))
+
+    def test_team_change_moves_totals(self):
+        game_stats = self.add_game(self.game1, goals=2, time_on_ice_seconds=900)
+
+        game_stats.team = self.sabres
+        game_stats.save()
+
+        old = self.season_stats(self.bruins)
+        self.assertEqual((old.games_played, old.goals, old.time_on_ice_seconds), (0, 0, 0))
+        new = self.season_stats(self.sabres)
+        self.assertEqual((new.games_played, new.goals, new.time_on_ice_seconds), (1, 2, 900))
+
+    def test_delete_subtracts(self):
+        self.add_game(self.game1, goals=1, time_on_ice_seconds=1000)
+        game_stats = self.add_game(self.game2, goals=2, time_on_ice_seconds=600)
+
+        game_stats.delete()
+
+        stats = self.season_stats()
+        self.assertEqual((stats.games_played, stats.goals, stats.time_on_ice_seconds), (1, 1, 1000))
+        self.assertEqual(stats.average_time_on_ice_seconds, 1000)
+
+
+class RebuildPlayerStatsTests(PlayerStatsTestCase):
+    """rebuild_player_stats reconciles season rows against the game rows"""
+
+    def rebuild(self, **options):
+        call_command('rebuild_player_stats', stdout=StringIO(), **options)
+
+    def test_corrects_drifted_totals(self):
+        self.add_game(self.game1, goals=2, time_on_ice_seconds=1000)
+        PlayerStats.objects.update(goals=9, games_played=5)
+
+        self.rebuild()
+
+        stats = self.season_stats()
+        self.assertEqual((stats.games_played, stats.goals), (1, 2))
+
+    def test_zeroes_rows_without_game_stats(self):
+        self.add_game(self.game1, goals=2, time_on_ice_seconds=1000)
+        PlayerGameStats.objects.all()._raw_delete('default')
+
+        self.rebuild()
+
+        stats = self.season_stats()
+        self.assertEqual((stats.games_played, stats.goals, stats.time_on_ice_seconds), (0, 0, 0))
+
+    def test_unknown_season(self):
+        with self.assertRaisesMessage(CommandError, "Season '1999-00' does not exist"):
+            self.rebuild(season='1999-00')
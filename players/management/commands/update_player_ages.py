@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Case, Q, Value, When
+from django.db.models.functions import ExtractYear
+from django.utils import timezone
+from players.models import Player
+
+
+class Command(BaseCommand):
+    help = 'Recalculate stored player ages as birthdays pass (schedule daily, e.g. cron at 00:05 UTC)'
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+        birthday_pending = (
+            Q(birth_date__month__gt=today.month) |
+            Q(birth_date__month=today.month, birth_date__day__gt=today.day)
+        )
+
+        updated = Player.objects.filter(birth_date__isnull=False).update(
+            age=Value(today.year) - ExtractYear('birth_date') - Case(
+                When(birthday_pending, then=Value(1)),
+                default=Value(0),
+            )
+        )
+
+        self.stdout.write(self.style.SUCCESS(f'Updated ages for {updated} players'))
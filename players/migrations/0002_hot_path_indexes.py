@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('players', '0001_initial'),
+        ('teams', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='playerstats',
+            index=models.Index(fields=['season', '-points'], name='players_pla_season__a9d7f1_idx'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:01
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('players', '0002_hot_path_indexes'),
+    ]
+
+    # Django cannot alter a column into a GeneratedField, so drop and re-add it
+    # (and the index that covers it).
+    operations = [
+        migrations.RemoveIndex(
+            model_name='playerstats',
+            name='players_pla_season__a9d7f1_idx',
+        ),
+        migrations.RemoveField(
+            model_name='playerstats',
+            name='points',
+        ),
+        migrations.RemoveField(
+            model_name='playerstats',
+            name='power_play_points',
+        ),
+        migrations.RemoveField(
+            model_name='playerstats',
+            name='short_handed_points',
+        ),
+        migrations.AddField(
+            model_name='playerstats',
+            name='points',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(models.F('goals'), '+', models.F('assists')), output_field=models.PositiveIntegerField()),
+        ),
+        migrations.AddField(
+            model_name='playerstats',
+            name='power_play_points',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(models.F('power_play_goals'), '+', models.F('power_play_assists')), output_field=models.PositiveIntegerField()),
+        ),
+        migrations.AddField(
+            model_name='playerstats',
+            name='short_handed_points',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(models.F('short_handed_goals'), '+', models.F('short_handed_assists')), output_field=models.PositiveIntegerField()),
+        ),
+        migrations.AddIndex(
+            model_name='playerstats',
+            index=models.Index(fields=['season', '-points'], name='players_pla_season__a9d7f1_idx'),
+        ),
+    ]
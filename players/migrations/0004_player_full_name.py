@@ -0,0 +1,41 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:05
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+def create_trigram_index(apps, schema_editor):
+    # Trigram index for full_name__icontains, which Django compiles to UPPER(...) LIKE
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX players_player_full_name_trgm ON players_player '
+        'USING gin (UPPER(full_name) gin_trgm_ops)'
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS players_player_full_name_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('players', '0003_generated_points'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='player',
+            name='full_name',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Concat('first_name', models.Value(' '), 'last_name'), output_field=models.CharField(max_length=201)),
+        ),
+        migrations.AddIndex(
+            model_name='player',
+            index=models.Index(fields=['full_name'], name='players_pla_full_na_c03349_idx'),
+        ),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
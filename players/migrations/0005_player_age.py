@@ -0,0 +1,37 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:05
+
+from django.db import migrations, models
+from django.utils import timezone
+
+# Rows written per bulk_update, so memory and statement size stay bounded
+BATCH_SIZE = 1000
+
+
+def backfill_ages(apps, schema_editor):
+    Player = apps.get_model('players', 'Player')
+    today = timezone.localdate()
+    batch = []
+    for player in Player.objects.filter(birth_date__isnull=False).only('birth_date').iterator(chunk_size=5000):
+        born = player.birth_date
+        player.age = today.year - born.year - ((today.month, today.day) < (born.month, born.day))
+        batch.append(player)
+        if len(batch) >= BATCH_SIZE:
+            Player.objects.bulk_update(batch, ['age'])
+            batch = []
+    Player.objects.bulk_update(batch, ['age'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('players', '0004_player_full_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='player',
+            name='age',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_ages, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:06
+
+from django.db import migrations, models
+from django.db.models import Exists, OuterRef, Q
+
+
+def keep_latest_current_history(apps, schema_editor):
+    # unique_player_current_team allows one current row per player; keep the latest
+    PlayerTeamHistory = apps.get_model('players', 'PlayerTeamHistory')
+    current = PlayerTeamHistory.objects.filter(is_current=True)
+    newer = current.filter(player=OuterRef('player')).filter(
+        Q(start_date__gt=OuterRef('start_date')) | Q(start_date=OuterRef('start_date'), pk__gt=OuterRef('pk'))
+    )
+    current.filter(Exists(newer)).update(is_current=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('players', '0005_player_age'),
+        ('teams', '0002_unique_constraints'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='playerstats',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='playerteamhistory',
+            unique_together=set(),
+        ),
+        migrations.AddIndex(
+            model_name='player',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['is_active'], name='player_active_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='playerstats',
+            constraint=models.UniqueConstraint(fields=('player', 'team', 'season'), name='unique_player_team_season_stats'),
+        ),
+        migrations.AddConstraint(
+            model_name='playerteamhistory',
+            constraint=models.UniqueConstraint(fields=('player', 'team', 'season'), name='unique_player_team_season_history'),
+        ),
+        migrations.RunPython(keep_latest_current_history, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='playerteamhistory',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_current', True)), fields=('player',), name='unique_player_current_team'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:07
+
+import django.db.models.expressions
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('players', '0006_unique_constraints'),
+    ]
+
+    # Django cannot alter a column into a GeneratedField, so drop and re-add it.
+    operations = [
+        migrations.RemoveField(
+            model_name='playerstats',
+            name='save_percentage',
+        ),
+        migrations.RemoveField(
+            model_name='playerstats',
+            name='shooting_percentage',
+        ),
+        migrations.AddField(
+            model_name='playerstats',
+            name='save_percentage',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.comparison.Cast(models.Case(models.When(shots_against__gt=0, then=django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(models.F('saves'), '*', models.Value(1.0)), '/', models.F('shots_against'))), default=models.Value(0.0)), output_field=models.DecimalField(decimal_places=3, max_digits=5)), output_field=models.DecimalField(decimal_places=3, max_digits=5)),
+        ),
+        migrations.AddField(
+            model_name='playerstats',
+            name='shooting_percentage',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.comparison.Cast(models.Case(models.When(shots_on_goal__gt=0, then=django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(models.F('goals'), '*', models.Value(100.0)), '/', models.F('shots_on_goal'))), default=models.Value(0.0)), output_field=models.DecimalField(decimal_places=2, max_digits=5)), output_field=models.DecimalField(decimal_places=2, max_digits=5)),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:31
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('players', '0007_generated_percentages'),
+    ]
+
+    # Django cannot alter a column into a GeneratedField, so drop and re-add it.
+    operations = [
+        migrations.RemoveField(
+            model_name='playerstats',
+            name='average_time_on_ice_seconds',
+        ),
+        migrations.AddField(
+            model_name='playerstats',
+            name='average_time_on_ice_seconds',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(games_played__gt=0, then=django.db.models.expressions.CombinedExpression(models.F('time_on_ice_seconds'), '/', models.F('games_played'))), default=models.Value(0)), output_field=models.PositiveIntegerField()),
+        ),
+    ]
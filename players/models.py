@@ -1,6 +1,9 @@
 from django.db import models
+from django.db.models import Case, F, Q, Value, When
+from django.db.models.functions import Cast, Concat
 from django.core.validators import MinValueValidator, MaxValueValidator
-from teams.models import Team, Season
+from django.utils import timezone
+from teams.models import AbbreviationManager, Team, Season
 
 
 class Position(models.Model):
@@ -13,9 +16,14 @@ class Position(models.Model):
         ('goalie', 'Goalie'),
     ])
 
+    objects = AbbreviationManager()
+
     def __str__(self):
         return self.name
 
+    def natural_key(self):
+        return (self.abbreviation,)
+
     class Meta:
         ordering = ['category', 'name']
 
@@ -25,6 +33,11 @@ class Player(models.Model):
     # Basic info
     first_name = models.CharField(max_length=100)
     last_name = models.CharField(max_length=100)
+    full_name = models.GeneratedField(
+        expression=Concat('first_name', Value(' '), 'last_name'),
+        output_field=models.CharField(max_length=201),
+        db_persist=True,
+    )
     jersey_number = models.PositiveIntegerField(
         validators=[MinValueValidator(1), MaxValueValidator(99)],
         null=True, blank=True
@@ -36,6 +49,7 @@ class Player(models.Model):
 
     # Personal details
     birth_date = models.DateField(null=True, blank=True)
+    age = models.PositiveSmallIntegerField(null=True, blank=True, editable=False)  # Set on save, rolled over by update_player_ages
     birth_city = models.CharField(max_length=100, blank=True)
     birth_country = models.CharField(max_length=100, blank=True)
     nationality = models.CharField(max_length=100, blank=True)
@@ -69,19 +83,27 @@ class Player(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
+        # full_name is computed by the database, so it's missing before the first save
+        if 'full_name' in self.__dict__:
+            return self.full_name
         return f"{self.first_name} {self.last_name}"
 
-    @property
-    def full_name(self):
-        return f"{self.first_name} {self.last_name}"
-
-    @property
-    def age(self):
+    def save(self, *args, **kwargs):
+        # Kept in step with birth_date here; update_player_ages rolls it over on birthdays
+        self.age = None
         if self.birth_date:
-            from datetime import date
-            today = date.today()
-            return today.year - self.birth_date.year - ((today.month, today.day) < (self.birth_date.month, self.birth_date.day))
-        return None
+            today = timezone.localdate()
+            born = self._meta.get_field('birth_date').to_python(self.birth_date)
+            self.age = today.year - born.year - ((today.month, today.day) < (born.month, born.day))
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'birth_date' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'age'}
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if not adding:
+            # Only an INSERT returns the recomputed full_name; drop the stale value so
+            # the next read loads it
+            self.__dict__.pop('full_name', None)
 
     @property
     def height_display(self):
@@ -94,6 +116,10 @@ class Player(models.Model):
 
     class Meta:
         ordering = ['last_name', 'first_name']
+        indexes = [
+            models.Index(fields=['full_name']),
+            models.Index(fields=['is_active'], condition=Q(is_active=True), name='player_active_idx'),
+        ]
 
 
 class PlayerTeamHistory(models.Model):
@@ -114,11 +140,16 @@ class PlayerTeamHistory(models.Model):
     is_current = models.BooleanField(default=False)
 
     def __str__(self):
-        return f"{self.player.full_name} - {self.team.full_name} ({self.season.name})"
+        return f"{self.player} - {self.team} ({self.season.name})"
 
     class Meta:
         ordering = ['-start_date']
-        unique_together = ['player', 'team', 'season']
+        constraints = [
+            models.UniqueConstraint(fields=['player', 'team', 'season'], name='unique_player_team_season_history'),
+            models.UniqueConstraint(
+                fields=['player'], condition=Q(is_current=True), name='unique_player_current_team'
+            ),
+        ]
 
 
 class PlayerStats(models.Model):
@@ -133,27 +164,56 @@ class PlayerStats(models.Model):
     # Scoring stats (for forwards/defense)
     goals = models.PositiveIntegerField(default=0)
     assists = models.PositiveIntegerField(default=0)
-    points = models.PositiveIntegerField(default=0)  # goals + assists
+    points = models.GeneratedField(
+        expression=F('goals') + F('assists'),
+        output_field=models.PositiveIntegerField(),
+        db_persist=True,
+    )
     plus_minus = models.IntegerField(default=0)
     penalty_minutes = models.PositiveIntegerField(default=0)
 
     # Power play stats
     power_play_goals = models.PositiveIntegerField(default=0)
     power_play_assists = models.PositiveIntegerField(default=0)
-    power_play_points = models.PositiveIntegerField(default=0)
+    power_play_points = models.GeneratedField(
+        expression=F('power_play_goals') + F('power_play_assists'),
+        output_field=models.PositiveIntegerField(),
+        db_persist=True,
+    )
 
     # Short handed stats
     short_handed_goals = models.PositiveIntegerField(default=0)
     short_handed_assists = models.PositiveIntegerField(default=0)
-    short_handed_points = models.PositiveIntegerField(default=0)
+    short_handed_points = models.GeneratedField(
+        expression=F('short_handed_goals') + F('short_handed_assists'),
+        output_field=models.PositiveIntegerField(),
+        db_persist=True,
+    )
 
     # Shooting stats
     shots_on_goal = models.PositiveIntegerField(default=0)
-    shooting_percentage = models.DecimalField(max_digits=5, decimal_places=2, default=0.0)
+    shooting_percentage = models.GeneratedField(
+        expression=Cast(
+            Case(
+                When(shots_on_goal__gt=0, then=F('goals') * 100.0 / F('shots_on_goal')),
+                default=Value(0.0),
+            ),
+            output_field=models.DecimalField(max_digits=5, decimal_places=2),
+        ),
+        output_field=models.DecimalField(max_digits=5, decimal_places=2),
+        db_persist=True,
+    )
 
     # Time stats
     time_on_ice_seconds = models.PositiveIntegerField(default=0)  # Total TOI in seconds
-    average_time_on_ice_seconds = models.PositiveIntegerField(default=0)  # Average TOI per game
+    average_time_on_ice_seconds = models.GeneratedField(  # Average TOI per game
+        expression=Case(
+            When(games_played__gt=0, then=F('time_on_ice_seconds') / F('games_played')),
+            default=Value(0),
+        ),
+        output_field=models.PositiveIntegerField(),
+        db_persist=True,
+    )
 
     # Goalie stats
     wins = models.PositiveIntegerField(default=0)
@@ -164,30 +224,24 @@ class PlayerStats(models.Model):
     shots_against = models.PositiveIntegerField(default=0)
     saves = models.PositiveIntegerField(default=0)
     goals_against_average = models.DecimalField(max_digits=4, decimal_places=2, default=0.0)
-    save_percentage = models.DecimalField(max_digits=5, decimal_places=3, default=0.0)
+    save_percentage = models.GeneratedField(
+        expression=Cast(
+            Case(
+                When(shots_against__gt=0, then=F('saves') * 1.0 / F('shots_against')),
+                default=Value(0.0),
+            ),
+            output_field=models.DecimalField(max_digits=5, decimal_places=3),
+        ),
+        output_field=models.DecimalField(max_digits=5, decimal_places=3),
+        db_persist=True,
+    )
 
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
-    def save(self, *args, **kwargs):
-        # Auto-calculate derived stats
-        self.points = self.goals + self.assists
-        self.power_play_points = self.power_play_goals + self.power_play_assists
-        self.short_handed_points = self.short_handed_goals + self.short_handed_assists
-
-        # Calculate shooting percentage
-        if self.shots_on_goal > 0:
-            self.shooting_percentage = (self.goals / self.shots_on_goal) * 100
-
-        # Calculate save percentage
-        if self.shots_against > 0:
-            self.save_percentage = (self.saves / self.shots_against)
-
-        super().save(*args, **kwargs)
-
     def __str__(self):
-        return f"{self.player.full_name} - {self.season.name} ({self.team.abbreviation})"
+        return f"{self.player} - {self.season.name} ({self.team.abbreviation})"
 
     @property
     def average_time_on_ice_display(self):
@@ -200,4 +254,9 @@ class PlayerStats(models.Model):
 
     class Meta:
         ordering = ['-season__start_date', '-points']
-        unique_together = ['player', 'team', 'season']
+        constraints = [
+            models.UniqueConstraint(fields=['player', 'team', 'season'], name='unique_player_team_season_stats'),
+        ]
+        indexes = [
+            models.Index(fields=['season', '-points']),
+        ]
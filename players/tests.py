@@ -1,3 +1,69 @@
+from datetime import date
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
 from django.test import TestCase
 
-# Create your tests here.
+from .models import Player, Position
+
+TODAY = date(2025, 3, 15)
+
+
+@mock.patch('django.utils.timezone.localdate', return_value=TODAY)
+class PlayerAgeTests(TestCase):
+    """Player.age is set on save and rolled over by update_player_ages"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name='Center', abbreviation='C', category='forward')
+
+    def add_player(self, last_name, birth_date):
+        return Player.objects.create(
+            first_name='David', last_name=last_name, position=self.position, birth_date=birth_date
+        )
+
+    def test_set_on_create(self, localdate):
+        self.assertEqual(self.add_player('Pastrnak', date(1996, 5, 25)).age, 28)
+        self.assertIsNone(self.add_player('Unknown', None).age)
+
+    def test_birth_date_change(self, localdate):
+        player = self.add_player('Pastrnak', date(1996, 5, 25))
+
+        player.birth_date = '1990-01-01'
+        player.save(update_fields=['birth_date'])
+
+        player.refresh_from_db()
+        self.assertEqual(player.age, 35)
+
+    def test_command_rolls_over_on_birthday(self, localdate):
+        yesterday = self.add_player('Yesterday', date(1995, 3, 14))
+        today = self.add_player('Today', date(1995, 3, 15))
+        tomorrow = self.add_player('Tomorrow', date(1995, 3, 16))
+        Player.objects.update(age=0)
+
+        call_command('update_player_ages', stdout=StringIO())
+
+        ages = dict(Player.objects.values_list('pk', 'age'))
+        self.assertEqual([ages[yesterday.pk], ages[today.pk], ages[tomorrow.pk]], [30, 30, 29])
+
+
+class PlayerFullNameTests(TestCase):
+    """full_name is computed by the database but never read stale or before saving"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name='Center', abbreviation='C', category='forward')
+
+    def test_unsaved_str(self):
+        self.assertEqual(str(Player(first_name='David', last_name='Pastrnak', position=self.position)), 'David Pastrnak')
+
+    def test_rename(self):
+        player = Player.objects.create(first_name='David', last_name='Pastrnak', position=self.position)
+        self.assertEqual(player.full_name, 'David Pastrnak')
+
+        player.last_name = 'Krejci'
+        player.save()
+
+        self.assertEqual(str(player), 'David Krejci')
+        self.assertEqual(player.full_name, 'David Krejci')
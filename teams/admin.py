@@ -1,29 +1,59 @@
-from django.contrib import admin
+import re
+
+from django.contrib import admin, messages
+from django.contrib.postgres.search import SearchQuery
+from django.db import connection
+from django.db.models import F
+from django.db.models.expressions import DatabaseDefault
 from .models import Conference, Division, Team, Season
 
 
+def is_changelist(request, opts):
+    """Whether the request is for opts' changelist, where column trimming is safe"""
+    match = request.resolver_match
+    return match is not None and match.url_name == f'{opts.app_label}_{opts.model_name}_changelist'
+
+
+class CreatedAtMixin:
+    """Read-only created_at that renders as empty on the add page"""
+
+    @admin.display(description='Created at', ordering='created_at')
+    def created(self, obj):
+        # Unsaved objects hold a DatabaseDefault until the INSERT returns the real value
+        return None if isinstance(obj.created_at, DatabaseDefault) else obj.created_at
+
+
 @admin.register(Conference)
 class ConferenceAdmin(admin.ModelAdmin):
     list_display = ['name', 'abbreviation', 'created_at']
     search_fields = ['name', 'abbreviation']
     ordering = ['name']
+    list_per_page = 50
+    show_full_result_count = False
 
 
 @admin.register(Division)
 class DivisionAdmin(admin.ModelAdmin):
     list_display = ['name', 'abbreviation', 'conference', 'created_at']
     list_filter = ['conference']
-    search_fields = ['name', 'abbreviation', 'conference__name']
+    list_select_related = ['conference']
+    search_fields = ['^name', '^abbreviation', '^conference__name']
     ordering = ['conference__name', 'name']
+    list_per_page = 50
+    show_full_result_count = False
 
 
 @admin.register(Team)
-class TeamAdmin(admin.ModelAdmin):
+class TeamAdmin(CreatedAtMixin, admin.ModelAdmin):
     list_display = ['full_name', 'abbreviation', 'division', 'conference', 'is_active']
     list_filter = ['division__conference', 'division', 'is_active']
-    search_fields = ['name', 'city', 'abbreviation']
+    list_select_related = ['division__conference']
+    # Prefix and exact lookups outside PostgreSQL, which searches search_vector instead
+    search_fields = ['^full_name', '=abbreviation']
     ordering = ['city', 'name']
-    readonly_fields = ['created_at', 'updated_at']
+    list_per_page = 50
+    show_full_result_count = False
+    readonly_fields = ['created', 'updated_at']
 
     fieldsets = (
         ('Basic Information', {
@@ -40,16 +70,57 @@ class TeamAdmin(admin.ModelAdmin):
             'fields': ('is_active',)
         }),
         ('Timestamps', {
-            'fields': ('created_at', 'updated_at'),
+            'fields': ('created', 'updated_at'),
             'classes': ('collapse',)
         })
     )
 
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request).annotate(_conference_name=F('division__conference__name'))
+        if is_changelist(request, self.opts):
+            # Branding and arena columns are only shown on the change form
+            queryset = queryset.only(
+                'name', 'city', 'full_name', 'abbreviation', 'is_active',
+                'division__name', 'division__conference__name',
+            )
+        return queryset
+
+    def get_search_results(self, request, queryset, search_term):
+        # On PostgreSQL match prefixes of every word against the GIN-indexed search_vector
+        words = re.findall(r'\w+', search_term)
+        if connection.vendor != 'postgresql' or not words:
+            return super().get_search_results(request, queryset, search_term)
+        query = SearchQuery(' & '.join(f'{word}:*' for word in words), config='simple', search_type='raw')
+        return queryset.filter(search_vector=query), False
+
+    @admin.display(ordering='_conference_name', description='Conference')
+    def conference(self, obj):
+        return obj._conference_name
+
 
 @admin.register(Season)
-class SeasonAdmin(admin.ModelAdmin):
+class SeasonAdmin(CreatedAtMixin, admin.ModelAdmin):
     list_display = ['name', 'start_date', 'end_date', 'is_current', 'created_at']
     list_filter = ['is_current']
     search_fields = ['name']
     ordering = ['-start_date']
-    readonly_fields = ['created_at']
+    list_per_page = 50
+    show_full_result_count = False
+    # one_current_season would reject ticking a second season; use the action instead
+    readonly_fields = ['is_current', 'created']
+    actions = ['make_current']
+
+    @admin.action(description='Make selected season the current season')
+    def make_current(self, request, queryset):
+        if len(queryset) != 1:
+            self.message_user(request, 'Select exactly one season to make current.', messages.ERROR)
+            return
+        season = queryset[0]
+        Season.objects.set_current(season.pk)
+        self.message_user(request, f'{season} is now the current season.', messages.SUCCESS)
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if is_changelist(request, self.opts):
+            queryset = queryset.defer('playoffs_start_date')
+        return queryset
@@ -1,121 +1,185 @@
+import csv
+import io
+
 from django.core.management.base import BaseCommand
+from django.db import connection, transaction
 from teams.models import Conference, Division, Team, Season
 from players.models import Position
 from datetime import date
 
 
+# (name, abbreviation)
+CONFERENCES = (
+    ('Eastern Conference', 'EC'),
+    ('Western Conference', 'WC'),
+)
+
+# (name, abbreviation, conference abbreviation)
+DIVISIONS = (
+    ('Atlantic Division', 'ATL', 'EC'),
+    ('Metropolitan Division', 'MET', 'EC'),
+    ('Central Division', 'CEN', 'WC'),
+    ('Pacific Division', 'PAC', 'WC'),
+)
+
+# (name, city, abbreviation, division abbreviation)
+TEAMS = (
+    # Atlantic Division
+    ('Bruins', 'Boston', 'BOS', 'ATL'),
+    ('Sabres', 'Buffalo', 'BUF', 'ATL'),
+    ('Red Wings', 'Detroit', 'DET', 'ATL'),
+    ('Panthers', 'Florida', 'FLA', 'ATL'),
+    ('Canadiens', 'Montreal', 'MTL', 'ATL'),
+    ('Senators', 'Ottawa', 'OTT', 'ATL'),
+    ('Lightning', 'Tampa Bay', 'TBL', 'ATL'),
+    ('Maple Leafs', 'Toronto', 'TOR', 'ATL'),
+
+    # Metropolitan Division
+    ('Hurricanes', 'Carolina', 'CAR', 'MET'),
+    ('Blue Jackets', 'Columbus', 'CBJ', 'MET'),
+    ('Devils', 'New Jersey', 'NJD', 'MET'),
+    ('Islanders', 'New York', 'NYI', 'MET'),
+    ('Rangers', 'New York', 'NYR', 'MET'),
+    ('Flyers', 'Philadelphia', 'PHI', 'MET'),
+    ('Penguins', 'Pittsburgh', 'PIT', 'MET'),
+    ('Capitals', 'Washington', 'WSH', 'MET'),
+
+    # Central Division
+    ('Coyotes', 'Arizona', 'ARI', 'CEN'),
+    ('Blackhawks', 'Chicago', 'CHI', 'CEN'),
+    ('Avalanche', 'Colorado', 'COL', 'CEN'),
+    ('Stars', 'Dallas', 'DAL', 'CEN'),
+    ('Wild', 'Minnesota', 'MIN', 'CEN'),
+    ('Predators', 'Nashville', 'NSH', 'CEN'),
+    ('Blues', 'St. Louis', 'STL', 'CEN'),
+    ('Jets', 'Winnipeg', 'WPG', 'CEN'),
+
+    # Pacific Division
+    ('Ducks', 'Anaheim', 'ANA', 'PAC'),
+    ('Flames', 'Calgary', 'CGY', 'PAC'),
+    ('Oilers', 'Edmonton', 'EDM', 'PAC'),
+    ('Kings', 'Los Angeles', 'LAK', 'PAC'),
+    ('Sharks', 'San Jose', 'SJS', 'PAC'),
+    ('Kraken', 'Seattle', 'SEA', 'PAC'),
+    ('Canucks', 'Vancouver', 'VAN', 'PAC'),
+    ('Golden Knights', 'Vegas', 'VGK', 'PAC'),
+)
+
+# (name, abbreviation, category)
+POSITIONS = (
+    ('Center', 'C', 'forward'),
+    ('Left Wing', 'LW', 'forward'),
+    ('Right Wing', 'RW', 'forward'),
+    ('Left Defense', 'LD', 'defense'),
+    ('Right Defense', 'RD', 'defense'),
+    ('Goalie', 'G', 'goalie'),
+)
+
+
+def copy_insert(model, objs):
+    """PostgreSQL fast path for bulk_create(objs, ignore_conflicts=True)
+
+    COPY can't skip duplicates itself, so rows are streamed into a temporary
+    staging table and moved across with INSERT ... ON CONFLICT DO NOTHING.
+    """
+    # Columns with a database default are left for the server to fill in
+    fields = [
+        f for f in model._meta.concrete_fields
+        if not f.primary_key and not f.generated and not f.has_db_default()
+    ]
+    quote = connection.ops.quote_name
+    table = quote(model._meta.db_table)
+    staging = quote(f'{model._meta.db_table}_staging')
+    columns = ', '.join(quote(f.column) for f in fields)
+    # Every value is quoted, so only nullable columns may read "" back as NULL
+    nullable = ', '.join(quote(f.column) for f in fields if f.null)
+    options = f'FORMAT csv, FORCE_NULL ({nullable})' if nullable else 'FORMAT csv'
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC)
+    for obj in objs:
+        writer.writerow([f.get_db_prep_save(f.pre_save(obj, True), connection) for f in fields])
+    buffer.seek(0)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'CREATE TEMP TABLE {staging} ON COMMIT DROP AS SELECT {columns} FROM {table} WITH NO DATA')
+        cursor.copy_expert(f'COPY {staging} ({columns}) FROM STDIN WITH ({options})', buffer)
+        cursor.execute(f'INSERT INTO {table} ({columns}) SELECT {columns} FROM {staging} ON CONFLICT DO NOTHING')
+        # Dropped now rather than at commit, so repeat calls within one outer transaction work
+        cursor.execute(f'DROP TABLE {staging}')
+
+
 class Command(BaseCommand):
     help = 'Populate database with initial NHL data'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='Run even if the data is already present')
+
+    def is_seeded(self):
+        return (
+            Team.objects.filter(abbreviation__in=[team[2] for team in TEAMS]).count() == len(TEAMS)
+            and Position.objects.filter(abbreviation__in=[pos[1] for pos in POSITIONS]).count() == len(POSITIONS)
+            and Season.objects.filter(name='2024-25').exists()
+        )
+
     def handle(self, *args, **options):
         self.stdout.write(self.style.SUCCESS('Starting to populate database...'))
 
-        # Create conferences
-        eastern, created = Conference.objects.get_or_create(
-            name='Eastern Conference',
-            defaults={'abbreviation': 'EC'}
-        )
-        western, created = Conference.objects.get_or_create(
-            name='Western Conference',
-            defaults={'abbreviation': 'WC'}
-        )
+        # One transaction, so seeding pays for a single commit
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                # Serialize concurrent runs; released when the transaction ends
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT pg_advisory_xact_lock(hashtext('populate_initial_data'))")
 
-        # Create divisions
-        atlantic, created = Division.objects.get_or_create(
-            name='Atlantic Division',
-            defaults={'abbreviation': 'ATL', 'conference': eastern}
-        )
-        metropolitan, created = Division.objects.get_or_create(
-            name='Metropolitan Division',
-            defaults={'abbreviation': 'MET', 'conference': eastern}
-        )
-        central, created = Division.objects.get_or_create(
-            name='Central Division',
-            defaults={'abbreviation': 'CEN', 'conference': western}
-        )
-        pacific, created = Division.objects.get_or_create(
-            name='Pacific Division',
-            defaults={'abbreviation': 'PAC', 'conference': western}
-        )
+            if not options['force'] and self.is_seeded():
+                self.stdout.write('Already seeded, skipping (use --force to run anyway)')
+                return
 
-        # Create current season
-        current_season, created = Season.objects.get_or_create(
-            name='2024-25',
-            defaults={
-                'start_date': date(2024, 10, 4),
-                'end_date': date(2025, 4, 18),
-                'playoffs_start_date': date(2025, 4, 21),
-                'is_current': True
-            }
-        )
+            # Create conferences
+            Conference.objects.bulk_create([
+                Conference(name=name, abbreviation=abbreviation) for name, abbreviation in CONFERENCES
+            ], ignore_conflicts=True)
+            conferences = Conference.objects.in_bulk(field_name='abbreviation')
 
-        # Create some NHL teams
-        teams_data = [
-            # Atlantic Division
-            {'name': 'Bruins', 'city': 'Boston', 'abbreviation': 'BOS', 'division': atlantic},
-            {'name': 'Sabres', 'city': 'Buffalo', 'abbreviation': 'BUF', 'division': atlantic},
-            {'name': 'Red Wings', 'city': 'Detroit', 'abbreviation': 'DET', 'division': atlantic},
-            {'name': 'Panthers', 'city': 'Florida', 'abbreviation': 'FLA', 'division': atlantic},
-            {'name': 'Canadiens', 'city': 'Montreal', 'abbreviation': 'MTL', 'division': atlantic},
-            {'name': 'Senators', 'city': 'Ottawa', 'abbreviation': 'OTT', 'division': atlantic},
-            {'name': 'Lightning', 'city': 'Tampa Bay', 'abbreviation': 'TBL', 'division': atlantic},
-            {'name': 'Maple Leafs', 'city': 'Toronto', 'abbreviation': 'TOR', 'division': atlantic},
-
-            # Metropolitan Division
-            {'name': 'Hurricanes', 'city': 'Carolina', 'abbreviation': 'CAR', 'division': metropolitan},
-            {'name': 'Blue Jackets', 'city': 'Columbus', 'abbreviation': 'CBJ', 'division': metropolitan},
-            {'name': 'Devils', 'city': 'New Jersey', 'abbreviation': 'NJD', 'division': metropolitan},
-            {'name': 'Islanders', 'city': 'New York', 'abbreviation': 'NYI', 'division': metropolitan},
-            {'name': 'Rangers', 'city': 'New York', 'abbreviation': 'NYR', 'division': metropolitan},
-            {'name': 'Flyers', 'city': 'Philadelphia', 'abbreviation': 'PHI', 'division': metropolitan},
-            {'name': 'Penguins', 'city': 'Pittsburgh', 'abbreviation': 'PIT', 'division': metropolitan},
-            {'name': 'Capitals', 'city': 'Washington', 'abbreviation': 'WSH', 'division': metropolitan},
-
-            # Central Division
-            {'name': 'Coyotes', 'city': 'Arizona', 'abbreviation': 'ARI', 'division': central},
-            {'name': 'Blackhawks', 'city': 'Chicago', 'abbreviation': 'CHI', 'division': central},
-            {'name': 'Avalanche', 'city': 'Colorado', 'abbreviation': 'COL', 'division': central},
-            {'name': 'Stars', 'city': 'Dallas', 'abbreviation': 'DAL', 'division': central},
-            {'name': 'Wild', 'city': 'Minnesota', 'abbreviation': 'MIN', 'division': central},
-            {'name': 'Predators', 'city': 'Nashville', 'abbreviation': 'NSH', 'division': central},
-            {'name': 'Blues', 'city': 'St. Louis', 'abbreviation': 'STL', 'division': central},
-            {'name': 'Jets', 'city': 'Winnipeg', 'abbreviation': 'WPG', 'division': central},
-
-            # Pacific Division
-            {'name': 'Ducks', 'city': 'Anaheim', 'abbreviation': 'ANA', 'division': pacific},
-            {'name': 'Flames', 'city': 'Calgary', 'abbreviation': 'CGY', 'division': pacific},
-            {'name': 'Oilers', 'city': 'Edmonton', 'abbreviation': 'EDM', 'division': pacific},
-            {'name': 'Kings', 'city': 'Los Angeles', 'abbreviation': 'LAK', 'division': pacific},
-            {'name': 'Sharks', 'city': 'San Jose', 'abbreviation': 'SJS', 'division': pacific},
-            {'name': 'Kraken', 'city': 'Seattle', 'abbreviation': 'SEA', 'division': pacific},
-            {'name': 'Canucks', 'city': 'Vancouver', 'abbreviation': 'VAN', 'division': pacific},
-            {'name': 'Golden Knights', 'city': 'Vegas', 'abbreviation': 'VGK', 'division': pacific},
-        ]
-
-        for team_data in teams_data:
-            team, created = Team.objects.get_or_create(
-                abbreviation=team_data['abbreviation'],
-                defaults=team_data
-            )
-            if created:
-                self.stdout.write(f'Created team: {team.full_name}')
-
-        # Create positions
-        positions_data = [
-            {'name': 'Center', 'abbreviation': 'C', 'category': 'forward'},
-            {'name': 'Left Wing', 'abbreviation': 'LW', 'category': 'forward'},
-            {'name': 'Right Wing', 'abbreviation': 'RW', 'category': 'forward'},
-            {'name': 'Left Defense', 'abbreviation': 'LD', 'category': 'defense'},
-            {'name': 'Right Defense', 'abbreviation': 'RD', 'category': 'defense'},
-            {'name': 'Goalie', 'abbreviation': 'G', 'category': 'goalie'},
-        ]
-
-        for pos_data in positions_data:
-            position, created = Position.objects.get_or_create(
-                abbreviation=pos_data['abbreviation'],
-                defaults=pos_data
+            # Create divisions
+            Division.objects.bulk_create([
+                Division(name=name, abbreviation=abbreviation, conference=conferences[conference])
+                for name, abbreviation, conference in DIVISIONS
+            ], ignore_conflicts=True)
+            divisions = Division.objects.in_bulk(field_name='abbreviation')
+
+            # Create current season
+            current_season, created = Season.objects.get_or_create(
+                name='2024-25',
+                defaults={
+                    'start_date': date(2024, 10, 4),
+                    'end_date': date(2025, 4, 18),
+                    'playoffs_start_date': date(2025, 4, 21),
+                }
             )
             if created:
-                self.stdout.write(f'Created position: {position.name}')
+                Season.objects.set_current(current_season.pk)
+
+            # Create some NHL teams
+            teams = [
+                Team(name=name, city=city, abbreviation=abbreviation, division_id=divisions[division].id)
+                for name, city, abbreviation, division in TEAMS
+            ]
+            if connection.vendor == 'postgresql':
+                copy_insert(Team, teams)
+            else:
+                Team.objects.bulk_create(teams, ignore_conflicts=True, batch_size=500)
+
+            # Create positions
+            positions = [
+                Position(name=name, abbreviation=abbreviation, category=category)
+                for name, abbreviation, category in POSITIONS
+            ]
+            if connection.vendor == 'postgresql':
+                copy_insert(Position, positions)
+            else:
+                Position.objects.bulk_create(positions, ignore_conflicts=True)
 
+        self.stdout.write(f'Ensured {len(TEAMS)} teams and {len(POSITIONS)} positions')
         self.stdout.write(self.style.SUCCESS('Database populated successfully!'))
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teams', '0002_unique_constraints'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='season',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_current', True)), fields=('is_current',), name='one_current_season'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teams', '0003_one_current_season'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='division',
+            index=models.Index(fields=['conference', 'name'], name='teams_divis_confere_922f45_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='season',
+            index=models.Index(fields=['-start_date'], name='teams_seaso_start_d_709428_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='team',
+            index=models.Index(fields=['division', 'is_active'], name='team_div_active_idx'),
+        ),
+    ]
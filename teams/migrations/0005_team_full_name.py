@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:14
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teams', '0004_admin_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='team',
+            name='full_name',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Concat('city', models.Value(' '), 'name'), output_field=models.CharField(max_length=201)),
+        ),
+        migrations.AddIndex(
+            model_name='team',
+            index=models.Index(fields=['full_name'], name='teams_team_full_na_66af78_idx'),
+        ),
+    ]
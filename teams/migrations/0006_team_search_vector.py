@@ -0,0 +1,43 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:16
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+def create_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE TRIGGER teams_team_search_vector_update '
+        'BEFORE INSERT OR UPDATE OF city, name, abbreviation ON teams_team '
+        'FOR EACH ROW EXECUTE FUNCTION '
+        "tsvector_update_trigger(search_vector, 'pg_catalog.simple', city, name, abbreviation)"
+    )
+    schema_editor.execute(
+        "UPDATE teams_team SET search_vector = to_tsvector('pg_catalog.simple', "
+        "city || ' ' || name || ' ' || abbreviation)"
+    )
+    schema_editor.execute('CREATE INDEX team_search_vector_gin ON teams_team USING gin (search_vector)')
+
+
+def drop_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS team_search_vector_gin')
+    schema_editor.execute('DROP TRIGGER IF EXISTS teams_team_search_vector_update ON teams_team')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teams', '0005_team_full_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='team',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_trigger, drop_search_trigger),
+    ]
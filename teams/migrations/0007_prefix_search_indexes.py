@@ -0,0 +1,34 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:19
+
+from django.db import migrations
+
+
+def create_prefix_indexes(apps, schema_editor):
+    # istartswith compiles to UPPER(col) LIKE UPPER('x%') on PostgreSQL, which the
+    # plain unique btree (and its _like twin) can't serve
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX conference_name_prefix ON teams_conference (UPPER(name::text) text_pattern_ops)'
+    )
+    schema_editor.execute(
+        'CREATE INDEX division_name_prefix ON teams_division (UPPER(name::text) text_pattern_ops)'
+    )
+
+
+def drop_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS conference_name_prefix')
+    schema_editor.execute('DROP INDEX IF EXISTS division_name_prefix')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teams', '0006_team_search_vector'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_indexes, drop_prefix_indexes),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:18
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teams', '0008_created_at_db_default'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='team',
+            name='unique_team_city_name',
+        ),
+    ]
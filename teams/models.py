@@ -1,16 +1,50 @@
-from django.db import models
+from functools import cached_property
+
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
+from django.db.models import Value
+from django.db.models.functions import Concat, Now
 from django.utils import timezone
 
 
+def _raw_cascade_delete(queryset):
+    """Delete queryset's rows and their CASCADE dependents, one statement per table
+
+    Unlike QuerySet.delete() nothing is loaded into Python, so signals and
+    delete() overrides don't run.
+    """
+    deleted = 0
+    for relation in queryset.model._meta.related_objects:
+        if relation.many_to_many:
+            continue
+        related = relation.related_model._base_manager.filter(**{f'{relation.field.name}__in': queryset})
+        if relation.on_delete is models.CASCADE:
+            deleted += _raw_cascade_delete(related)
+        elif relation.on_delete is models.SET_NULL:
+            related.update(**{relation.field.name: None})
+    return deleted + queryset._raw_delete(queryset.db)
+
+
+class AbbreviationManager(models.Manager):
+    """Resolves natural keys for models identified by a unique abbreviation"""
+    def get_by_natural_key(self, abbreviation):
+        return self.get(abbreviation=abbreviation)
+
+
 class Conference(models.Model):
     """NHL Conference (Eastern, Western)"""
     name = models.CharField(max_length=50, unique=True)
     abbreviation = models.CharField(max_length=10, unique=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+
+    objects = AbbreviationManager()
 
     def __str__(self):
         return self.name
 
+    def natural_key(self):
+        return (self.abbreviation,)
+
     class Meta:
         ordering = ['name']
 
@@ -20,19 +54,33 @@ class Division(models.Model):
     name = models.CharField(max_length=50, unique=True)
     abbreviation = models.CharField(max_length=10, unique=True)
     conference = models.ForeignKey(Conference, on_delete=models.CASCADE, related_name='divisions')
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+
+    objects = AbbreviationManager()
 
     def __str__(self):
         return f"{self.name} ({self.conference.name})"
 
+    def natural_key(self):
+        return (self.abbreviation,)
+    natural_key.dependencies = ['teams.conference']
+
     class Meta:
         ordering = ['conference__name', 'name']
+        indexes = [
+            models.Index(fields=['conference', 'name']),
+        ]
 
 
 class Team(models.Model):
     """NHL Team"""
     name = models.CharField(max_length=100)
     city = models.CharField(max_length=100)
+    full_name = models.GeneratedField(
+        expression=Concat('city', Value(' '), 'name'),
+        output_field=models.CharField(max_length=201),
+        db_persist=True,
+    )
     abbreviation = models.CharField(max_length=10, unique=True)
     division = models.ForeignKey(Division, on_delete=models.CASCADE, related_name='teams')
 
@@ -48,23 +96,65 @@ class Team(models.Model):
 
     # Status
     is_active = models.BooleanField(default=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Full-text search document, maintained by a database trigger on PostgreSQL
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = AbbreviationManager()
+
     def __str__(self):
+        # full_name is computed by the database, so it's missing before the first save
+        if 'full_name' in self.__dict__:
+            return self.full_name
         return f"{self.city} {self.name}"
 
-    @property
-    def full_name(self):
-        return f"{self.city} {self.name}"
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if not adding:
+            # Only an INSERT returns the recomputed full_name; drop the stale value so
+            # the next read loads it
+            self.__dict__.pop('full_name', None)
 
-    @property
+    def natural_key(self):
+        return (self.abbreviation,)
+    natural_key.dependencies = ['teams.division']
+
+    @cached_property
     def conference(self):
         return self.division.conference
 
     class Meta:
         ordering = ['city', 'name']
-        unique_together = ['city', 'name']
+        indexes = [
+            models.Index(fields=['division', 'is_active'], name='team_div_active_idx'),
+            models.Index(fields=['full_name']),
+        ]
+
+
+class SeasonManager(models.Manager):
+    def get_by_natural_key(self, name):
+        return self.get(name=name)
+
+    def purge(self, pk):
+        """Delete a season and everything hanging off it without Django's delete collector"""
+        with transaction.atomic():
+            return _raw_cascade_delete(self.model._base_manager.filter(pk=pk))
+
+    def set_current(self, pk):
+        """Make the given season the only current one"""
+        # Deliberately two statements: a single CASE UPDATE can set the new row before
+        # clearing the old one, and one_current_season is checked row by row (partial
+        # unique indexes can't be deferred).
+        with transaction.atomic():
+            # Raises DoesNotExist for an unknown pk before anything is cleared
+            season = self.select_for_update().get(pk=pk)
+            if season.is_current:
+                return
+            self.filter(is_current=True).update(is_current=False)
+            self.filter(pk=pk).update(is_current=True)
 
 
 class Season(models.Model):
@@ -74,16 +164,22 @@ class Season(models.Model):
     end_date = models.DateField()
     playoffs_start_date = models.DateField(null=True, blank=True)
     is_current = models.BooleanField(default=False)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+
+    objects = SeasonManager()
 
     def __str__(self):
         return self.name
 
-    def save(self, *args, **kwargs):
-        # Ensure only one season is marked as current
-        if self.is_current:
-            Season.objects.filter(is_current=True).update(is_current=False)
-        super().save(*args, **kwargs)
+    def natural_key(self):
+        return (self.name,)
 
     class Meta:
         ordering = ['-start_date']
+        constraints = [
+            # At most one current season; switch with Season.objects.set_current()
+            models.UniqueConstraint(fields=['is_current'], condition=models.Q(is_current=True), name='one_current_season'),
+        ]
+        indexes = [
+            models.Index(fields=['-start_date']),
+        ]
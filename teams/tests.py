@@ -1,3 +1,183 @@
+from datetime import date, datetime, timezone
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
 from django.test import TestCase
 
-# Create your tests here.
+from fantasy.models import (
+    FantasyScoring, FantasyTeam, FantasyWeek, League, PlayerFantasyStats, Roster, RosterPosition, RosterSlot,
+)
+from games.models import Game, GameEvent, Goal, PlayerGameStats
+from players.models import Player, PlayerStats, PlayerTeamHistory, Position
+from .management.commands.populate_initial_data import CONFERENCES, DIVISIONS, POSITIONS, TEAMS
+from .models import Conference, Division, Season, Team
+
+
+class TeamFullNameTests(TestCase):
+    """full_name is computed by the database but never read stale or before saving"""
+
+    @classmethod
+    def setUpTestData(cls):
+        conference = Conference.objects.create(name='Eastern Conference', abbreviation='EC')
+        cls.division = Division.objects.create(name='Atlantic Division', abbreviation='ATL', conference=conference)
+
+    def test_unsaved_str(self):
+        self.assertEqual(str(Team(name='Bruins', city='Boston', division=self.division)), 'Boston Bruins')
+
+    def test_rename(self):
+        team = Team.objects.create(name='Bruins', city='Boston', abbreviation='BOS', division=self.division)
+
+        team.name = 'Braves'
+        team.save()
+
+        self.assertEqual(str(team), 'Boston Braves')
+        self.assertEqual(team.full_name, 'Boston Braves')
+
+
+class SeasonTestCase(TestCase):
+    """The current 2024-25 season and the upcoming 2025-26 one"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.season = Season.objects.create(
+            name='2024-25', start_date=date(2024, 10, 4), end_date=date(2025, 4, 18), is_current=True
+        )
+        cls.next_season = Season.objects.create(
+            name='2025-26', start_date=date(2025, 10, 7), end_date=date(2026, 4, 16)
+        )
+
+    def current_seasons(self):
+        return list(Season.objects.filter(is_current=True).values_list('name', flat=True))
+
+
+class SetCurrentSeasonTests(SeasonTestCase):
+    """Season.objects.set_current moves the single current flag"""
+
+    def test_switch(self):
+        Season.objects.set_current(self.next_season.pk)
+
+        self.assertEqual(self.current_seasons(), ['2025-26'])
+
+    def test_already_current(self):
+        Season.objects.set_current(self.season.pk)
+
+        self.assertEqual(self.current_seasons(), ['2024-25'])
+
+    def test_unknown_pk(self):
+        with self.assertRaises(Season.DoesNotExist):
+            Season.objects.set_current(0)
+
+        self.assertEqual(self.current_seasons(), ['2024-25'])
+
+
+class PurgeSeasonTests(SeasonTestCase):
+    """Season.objects.purge deletes a season's games, stats and leagues, and nothing else"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        conference = Conference.objects.create(name='Eastern Conference', abbreviation='EC')
+        division = Division.objects.create(name='Atlantic Division', abbreviation='ATL', conference=conference)
+        cls.bruins = Team.objects.create(name='Bruins', city='Boston', abbreviation='BOS', division=division)
+        cls.sabres = Team.objects.create(name='Sabres', city='Buffalo', abbreviation='BUF', division=division)
+        position = Position.objects.create(name='Center', abbreviation='C', category='forward')
+        cls.player = Player.objects.create(first_name='David', last_name='Pastrnak', position=position)
+        for season in (cls.season, cls.next_season):
+            cls.add_season_data(season)
+
+    @classmethod
+    def add_season_data(cls, season):
+        game = Game.objects.create(
+            home_team=cls.bruins, away_team=cls.sabres, season=season,
+            game_date=datetime(season.start_date.year, 10, 10, tzinfo=timezone.utc),
+        )
+        GameEvent.objects.create(
+            game=game, event_type='shot', period=1, time_in_period_seconds=75, game_time_seconds=75,
+            primary_player=cls.player, team=cls.bruins,
+        )
+        Goal.objects.create(
+            game=game, scorer=cls.player, team=cls.bruins, period=1, time_in_period_seconds=80, game_time_seconds=80,
+        )
+        PlayerGameStats.objects.create(player=cls.player, game=game, team=cls.bruins, goals=1)
+        PlayerTeamHistory.objects.create(
+            player=cls.player, team=cls.bruins, season=season, start_date=season.start_date,
+        )
+
+        owner = User.objects.create(username=f'owner-{season.name}')
+        league = League.objects.create(name='Original Six', season=season, commissioner=owner)
+        FantasyScoring.objects.create(league=league)
+        fantasy_team = FantasyTeam.objects.create(name='Lamplighters', owner=owner, league=league)
+        week = FantasyWeek.objects.create(
+            league=league, week_number=1, start_date=season.start_date, end_date=season.start_date,
+        )
+        PlayerFantasyStats.objects.create(player=cls.player, week=week, fantasy_team=fantasy_team, goals=1)
+        roster = Roster.objects.create(fantasy_team=fantasy_team)
+        RosterSlot.objects.create(
+            roster=roster, player=cls.player,
+            position=RosterPosition.objects.create(name='Center', abbreviation='C'),
+        )
+
+    def test_purge(self):
+        deleted = Season.objects.purge(self.season.pk)
+
+        self.assertFalse(Season.objects.filter(pk=self.season.pk).exists())
+        for model, season_field in [
+            (Game, 'season'), (GameEvent, 'game__season'), (Goal, 'game__season'),
+            (PlayerGameStats, 'game__season'), (PlayerStats, 'season'), (PlayerTeamHistory, 'season'),
+            (League, 'season'), (FantasyScoring, 'league__season'), (FantasyTeam, 'league__season'),
+            (FantasyWeek, 'league__season'), (PlayerFantasyStats, 'week__league__season'),
+            (Roster, 'fantasy_team__league__season'), (RosterSlot, 'roster__fantasy_team__league__season'),
+        ]:
+            with self.subTest(model=model.__name__):
+                self.assertEqual(model._base_manager.count(), 1)
+                self.assertTrue(model._base_manager.filter(**{season_field: self.next_season}).exists())
+        self.assertEqual(deleted, 14)
+        self.assertTrue(Player.objects.filter(pk=self.player.pk).exists())
+        self.assertEqual(Team.objects.count(), 2)
+
+    def test_unknown_pk(self):
+        self.assertEqual(Season.objects.purge(0), 0)
+
+        self.assertEqual(Season.objects.count(), 2)
+
+
+class PopulateInitialDataTests(TestCase):
+    """populate_initial_data seeds once, skips when seeded and fills gaps"""
+
+    def populate(self, **options):
+        out = StringIO()
+        call_command('populate_initial_data', stdout=out, **options)
+        return out.getvalue()
+
+    def assertSeeded(self):
+        self.assertEqual(Conference.objects.count(), len(CONFERENCES))
+        self.assertEqual(Division.objects.count(), len(DIVISIONS))
+        self.assertEqual(Team.objects.count(), len(TEAMS))
+        self.assertEqual(Position.objects.count(), len(POSITIONS))
+        self.assertEqual(list(Season.objects.values_list('name', 'is_current')), [('2024-25', True)])
+
+    def test_seed(self):
+        self.populate()
+
+        self.assertSeeded()
+        self.assertEqual(Team.objects.get(abbreviation='BOS').full_name, 'Boston Bruins')
+
+    def test_rerun_skips(self):
+        self.populate()
+
+        self.assertIn('Already seeded', self.populate())
+        self.assertSeeded()
+
+    def test_force_adds_no_duplicates(self):
+        self.populate()
+
+        self.assertNotIn('Already seeded', self.populate(force=True))
+        self.assertSeeded()
+
+    def test_restores_missing_rows(self):
+        self.populate()
+        Team.objects.filter(abbreviation='BOS').delete()
+
+        self.assertNotIn('Already seeded', self.populate())
+        self.assertSeeded()